@@ -8,7 +8,7 @@ import argparse
 from pathlib import Path
 
 
-def run_tests(test_type="all", verbose=False, coverage=False):
+def run_tests(test_type="all", verbose=False, coverage=False, workers=None):
     """Run tests with specified options"""
     
     # Base pytest command
@@ -20,6 +20,10 @@ def run_tests(test_type="all", verbose=False, coverage=False):
     else:
         cmd.append("-q")
     
+    # Run in parallel with pytest-xdist, keeping xdist_group tests together
+    if workers:
+        cmd.extend(["-n", workers, "--dist", "loadgroup"])
+    
     # Add coverage if requested
     if coverage:
         cmd.extend(["--cov=src", "--cov-report=html", "--cov-report=term"])
@@ -74,6 +78,11 @@ def main():
         help="Run tests with coverage reporting"
     )
     
+    parser.add_argument(
+        "-n", "--workers",
+        help="Number of pytest-xdist workers (e.g. 4 or auto)"
+    )
+    
     parser.add_argument(
         "--install-deps",
         action="store_true",
@@ -87,7 +96,7 @@ def main():
         print("Installing test dependencies...")
         subprocess.run([
             "pip", "install", 
-            "pytest", "pytest-asyncio", "pytest-cov", 
+            "pytest", "pytest-asyncio", "pytest-cov", "pytest-xdist",
             "httpx", "fastapi[all]"
         ])
     
@@ -95,7 +104,8 @@ def main():
     exit_code = run_tests(
         test_type=args.test_type,
         verbose=args.verbose,
-        coverage=args.coverage
+        coverage=args.coverage,
+        workers=args.workers
     )
     
     sys.exit(exit_code)
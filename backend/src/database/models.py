@@ -3,9 +3,13 @@ Database models for Yu-Gi-Oh Deck Builder
 SQLAlchemy-style models for database operations
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from functools import lru_cache
 import json
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field
 from ..database import get_db_connection
@@ -19,8 +23,29 @@ class ValidationError(Exception):
         super().__init__(f"Validation failed: {', '.join(errors)}")
 
 
+@lru_cache(maxsize=1024, typed=True)
+def _choice_errors(
+    value: Optional[str], field_name: str, choices: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    if value is not None and value not in choices:
+        return (f"{field_name} must be one of: {', '.join(choices)}",)
+    return ()
+
+
+def _cached_errors(check, *args) -> List[str]:
+    """Run a memoized check, computing directly when an argument is unhashable"""
+    try:
+        return list(check(*args))
+    except TypeError:
+        return list(check.__wrapped__(*args))
+
+
 class ModelValidator:
-    """Utility class for common validation operations"""
+    """Utility class for common validation operations
+
+    Only the choice check is memoized: its inputs are short enum-like values,
+    while hashing a long string costs as much as checking its length.
+    """
 
     @staticmethod
     def validate_string_length(
@@ -80,12 +105,7 @@ class ModelValidator:
     @staticmethod
     def validate_choice(value: str, field_name: str, choices: List[str]) -> List[str]:
         """Validate that value is in allowed choices"""
-        errors = []
-
-        if value is not None and value not in choices:
-            errors.append(f"{field_name} must be one of: {', '.join(choices)}")
-
-        return errors
+        return _cached_errors(_choice_errors, value, field_name, tuple(choices))
 
 
 @dataclass
@@ -820,6 +840,11 @@ class Deck:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    # (composition signature, errors) from the last validate_deck_composition run
+    _composition_cache: Optional[Tuple[tuple, Tuple[str, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def get_by_uuid(cls, deck_uuid: str) -> Optional["Deck"]:
         """Get deck by UUID"""
@@ -1002,15 +1027,40 @@ class Deck:
 
     def validate_deck_composition(self) -> List[str]:
         """Validate deck composition according to Yu-Gi-Oh rules"""
-        validation_errors = []
-
         if not self.id:
-            return validation_errors
+            return []
+
+        # One query for every section; the rule checks only re-run when the
+        # deck's contents differ from the last validated composition
+        cards = self.get_cards()
+        signature = self._composition_signature(cards)
+        cached = self._composition_cache
+        if cached is not None and cached[0] == signature:
+            validation_errors = list(cached[1])
+        else:
+            validation_errors = self._check_composition(cards)
+            self._composition_cache = (signature, tuple(validation_errors))
+
+        # Update deck validation status
+        self.validation_errors = validation_errors
+        self.is_valid = len(validation_errors) == 0
+
+        return validation_errors
+
+    @staticmethod
+    def _composition_signature(cards: List["DeckCard"]) -> tuple:
+        """Canonical, order-independent key for a deck's contents"""
+        return tuple(
+            sorted((card.card_id, card.section, card.quantity) for card in cards)
+        )
+
+    def _check_composition(self, cards: List["DeckCard"]) -> List[str]:
+        """Run the deck construction rules against the given cards"""
+        validation_errors = []
 
-        # Get card counts by section
-        main_deck_cards = self.get_cards("main")
-        extra_deck_cards = self.get_cards("extra")
-        side_deck_cards = self.get_cards("side")
+        main_deck_cards = [card for card in cards if card.section == "main"]
+        extra_deck_cards = [card for card in cards if card.section == "extra"]
+        side_deck_cards = [card for card in cards if card.section == "side"]
 
         # Calculate total quantities
         main_deck_count = sum(card.quantity for card in main_deck_cards)
@@ -1056,10 +1106,6 @@ class Deck:
                     f"'{card_name}' appears {total_quantity} times (maximum 3 allowed)"
                 )
 
-        # Update deck validation status
-        self.validation_errors = validation_errors
-        self.is_valid = len(validation_errors) == 0
-
         return validation_errors
 
     def _get_card_name(self, card_id: int) -> str:
@@ -1374,6 +1420,68 @@ class DeckCard:
         return True
 
 
+class _CardQueryCache:
+    """LRU cache of card_cache query rows
+
+    Cleared whenever this process writes card_cache; entries also expire after
+    a short TTL so rows written by other processes (sync tools) still show up.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[list]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, rows = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return rows
+
+    def put(self, key: tuple, rows: list):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), rows)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_card_query_cache = _CardQueryCache()
+
+
+def _fetch_card_rows(query: str, params) -> list:
+    """Run a card_cache SELECT, reusing rows from an identical recent query
+
+    Empty results are not cached, so a card written by another process right
+    after a failed lookup is found on the next query instead of after the TTL.
+    """
+    key = (query, tuple(params))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable filter value - never risk a wrong cache hit, just query
+        key = None
+
+    rows = _card_query_cache.get(key) if key is not None else None
+    if rows is None:
+        with get_db_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        if key is not None and rows:
+            _card_query_cache.put(key, rows)
+    return rows
+
+
 @dataclass
 class Card:
     """Card model for database operations and API integration"""
@@ -1400,33 +1508,30 @@ class Card:
     @classmethod
     def get_by_id(cls, card_id: int, fetch_if_missing: bool = True) -> Optional["Card"]:
         """Get card by ID from cache, optionally fetch from API if missing"""
-        with get_db_connection() as conn:
-            cursor = conn.execute("SELECT * FROM card_cache WHERE id = ?", (card_id,))
-            row = cursor.fetchone()
+        rows = _fetch_card_rows("SELECT * FROM card_cache WHERE id = ?", (card_id,))
 
-            if row:
-                return cls.from_db_row(row)
-            elif fetch_if_missing:
-                # Try to fetch from API
-                return cls.fetch_from_api(card_id)
-            else:
-                return None
+        if rows:
+            return cls.from_db_row(rows[0])
+        elif fetch_if_missing:
+            # Try to fetch from API
+            return cls.fetch_from_api(card_id)
+        else:
+            return None
 
     @classmethod
     def search_by_name(cls, name: str, exact_match: bool = False) -> List["Card"]:
         """Search cards by name in local cache"""
-        with get_db_connection() as conn:
-            if exact_match:
-                cursor = conn.execute(
-                    "SELECT * FROM card_cache WHERE name = ?", (name,)
-                )
-            else:
-                cursor = conn.execute(
-                    "SELECT * FROM card_cache WHERE name LIKE ? ORDER BY name",
-                    (f"%{name}%",),
-                )
+        if exact_match:
+            rows = _fetch_card_rows(
+                "SELECT * FROM card_cache WHERE name = ?", (name,)
+            )
+        else:
+            rows = _fetch_card_rows(
+                "SELECT * FROM card_cache WHERE name LIKE ? ORDER BY name",
+                (f"%{name}%",),
+            )
 
-            return [cls.from_db_row(row) for row in cursor.fetchall()]
+        return [cls.from_db_row(row) for row in rows]
 
     @classmethod
     def search_by_filters(cls, filters: Dict[str, Any]) -> List["Card"]:
@@ -1480,9 +1585,7 @@ class Card:
 
         query += " ORDER BY name LIMIT 1000"  # Limit results for performance
 
-        with get_db_connection() as conn:
-            cursor = conn.execute(query, params)
-            return [cls.from_db_row(row) for row in cursor.fetchall()]
+        return [cls.from_db_row(row) for row in _fetch_card_rows(query, params)]
 
     @classmethod
     def fetch_from_api(cls, card_id: int) -> Optional["Card"]:
@@ -1656,6 +1759,7 @@ class Card:
                 ),
             )
             conn.commit()
+        _card_query_cache.clear()
         return self
 
     def get_primary_image_url(self) -> Optional[str]:
@@ -1758,7 +1862,8 @@ class Card:
                 )
 
                 conn.commit()
-                return True
+            _card_query_cache.clear()
+            return True
 
         except Exception as e:
             print(f"Error saving card {self.id} to cache: {e}")
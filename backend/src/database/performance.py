@@ -7,6 +7,12 @@ from datetime import datetime
 import time
 from ..database import get_db_connection
 
+# How long get_database_statistics reuses its last result
+STATS_CACHE_TTL_SECONDS = 5.0
+
+# (monotonic time computed, statistics) from the last get_database_statistics call
+_stats_cache: Optional[tuple] = None
+
 
 class DatabasePerformance:
     """Utility class for database performance monitoring and optimization"""
@@ -43,8 +49,21 @@ class DatabasePerformance:
             }
 
     @staticmethod
-    def get_database_statistics() -> Dict[str, Any]:
-        """Get general database statistics"""
+    def get_database_statistics(refresh: bool = False) -> Dict[str, Any]:
+        """Get general database statistics
+
+        The row counts scan every table, so a result is reused for
+        STATS_CACHE_TTL_SECONDS unless refresh is set.
+        """
+        global _stats_cache
+
+        if (
+            not refresh
+            and _stats_cache is not None
+            and time.monotonic() - _stats_cache[0] < STATS_CACHE_TTL_SECONDS
+        ):
+            return dict(_stats_cache[1])
+
         with get_db_connection() as conn:
             stats = {}
 
@@ -79,7 +98,8 @@ class DatabasePerformance:
             cursor = conn.execute("PRAGMA cache_size")
             stats["cache_size"] = cursor.fetchone()[0]
 
-            return stats
+        _stats_cache = (time.monotonic(), stats)
+        return dict(stats)
 
     @staticmethod
     def get_slow_queries(min_execution_time_ms: float = 100) -> List[Dict[str, Any]]:
@@ -108,6 +128,11 @@ class DatabasePerformance:
     @staticmethod
     def optimize_database() -> Dict[str, Any]:
         """Run database optimization commands"""
+        global _stats_cache
+
+        # VACUUM changes the database size reported by the statistics
+        _stats_cache = None
+
         with get_db_connection() as conn:
             results = {}
 
@@ -215,15 +240,17 @@ class QueryProfiler:
     def __init__(self, query_name: str):
         self.query_name = query_name
         self.start_time = None
+        # Seconds spent inside the block, set on exit
+        self.elapsed = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            execution_time = time.time() - self.start_time
-            print(f"Query '{self.query_name}' executed in {execution_time*1000:.2f}ms")
+        if self.start_time is not None:
+            self.elapsed = time.perf_counter() - self.start_time
+            print(f"Query '{self.query_name}' executed in {self.elapsed*1000:.2f}ms")
 
 
 # Example usage:
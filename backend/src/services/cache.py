@@ -4,10 +4,11 @@ Caching service for API responses and card data
 
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Any, Optional, Dict, List
+import time
+from typing import Any, Callable, Optional, Dict, List
 import asyncio
 import hashlib
+from dataclasses import dataclass
 import diskcache as dc
 
 try:
@@ -20,6 +21,24 @@ except ImportError:
 from ..config import config
 
 
+@dataclass(slots=True, frozen=True)
+class CacheStats:
+    """Snapshot of cache layer sizes, reused until the cache changes"""
+
+    memory_cache_size: int
+    disk_cache_size: int
+    redis_available: bool
+    cache_directory: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "memory_cache_size": self.memory_cache_size,
+            "disk_cache_size": self.disk_cache_size,
+            "redis_available": self.redis_available,
+            "cache_directory": self.cache_directory,
+        }
+
+
 class CacheService:
     """
     Multi-level caching service that supports:
@@ -28,9 +47,16 @@ class CacheService:
     3. Redis cache (for production scaling)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.memory_cache: Dict[str, Dict[str, Any]] = {}
-        self.cache_dir = config.cache_directory
+        self.cache_dir = cache_dir or config.cache_directory
+
+        # Clock used for memory cache expiry, injectable for tests
+        self._clock = clock
 
         # Initialize disk cache
         self.disk_cache = dc.Cache(self.cache_dir)
@@ -38,6 +64,9 @@ class CacheService:
         # Redis connection (will be None if Redis is not available)
         self.redis_client: Optional[aioredis.Redis] = None
 
+        # Cached statistics snapshot, cleared whenever a cache layer changes
+        self._stats: Optional[CacheStats] = None
+
         # Cache configuration from config
         self.default_ttl = config.default_cache_ttl
         self.card_data_ttl = config.card_data_ttl
@@ -46,6 +75,7 @@ class CacheService:
     async def initialize_redis(self, redis_url: Optional[str] = None):
         """Initialize Redis connection if available"""
         redis_url = redis_url or config.redis_url
+        self._stats = None
 
         if REDIS_AVAILABLE:
             try:
@@ -71,20 +101,22 @@ class CacheService:
         # Check memory cache first
         if key in self.memory_cache:
             entry = self.memory_cache[key]
-            if entry["expires_at"] > datetime.now():
+            if entry["expires_at"] > self._clock():
                 return entry["data"]
             else:
                 # Remove expired entry
                 del self.memory_cache[key]
+                self._stats = None
 
         # Check disk cache
         try:
             data = self.disk_cache.get(key)
             if data is not None:
                 # Store in memory cache for faster access
+                self._stats = None
                 self.memory_cache[key] = {
                     "data": data,
-                    "expires_at": datetime.now() + timedelta(seconds=self.default_ttl),
+                    "expires_at": self._clock() + self.default_ttl,
                 }
                 return data
         except Exception as e:
@@ -97,10 +129,10 @@ class CacheService:
                 if data:
                     parsed_data = json.loads(data)
                     # Store in memory and disk cache
+                    self._stats = None
                     self.memory_cache[key] = {
                         "data": parsed_data,
-                        "expires_at": datetime.now()
-                        + timedelta(seconds=self.default_ttl),
+                        "expires_at": self._clock() + self.default_ttl,
                     }
                     self.disk_cache.set(key, parsed_data, expire=self.default_ttl)
                     return parsed_data
@@ -113,11 +145,12 @@ class CacheService:
         """Set value in all cache layers"""
         if ttl is None:
             ttl = self.default_ttl
+        self._stats = None
 
         # Store in memory cache
         self.memory_cache[key] = {
             "data": value,
-            "expires_at": datetime.now() + timedelta(seconds=ttl),
+            "expires_at": self._clock() + ttl,
         }
 
         # Store in disk cache
@@ -135,6 +168,8 @@ class CacheService:
 
     async def delete(self, key: str) -> None:
         """Delete value from all cache layers"""
+        self._stats = None
+
         # Remove from memory cache
         if key in self.memory_cache:
             del self.memory_cache[key]
@@ -154,7 +189,7 @@ class CacheService:
 
     async def clear_expired(self) -> None:
         """Clear expired entries from memory cache"""
-        now = datetime.now()
+        now = self._clock()
         expired_keys = [
             key
             for key, entry in self.memory_cache.items()
@@ -162,15 +197,29 @@ class CacheService:
         ]
         for key in expired_keys:
             del self.memory_cache[key]
+        if expired_keys:
+            self._stats = None
+
+    async def clear_all(self) -> None:
+        """Clear all entries from the memory and disk cache layers"""
+        self._stats = None
+        self.memory_cache.clear()
+
+        try:
+            self.disk_cache.clear()
+        except Exception as e:
+            print(f"Disk cache clear error: {e}")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        return {
-            "memory_cache_size": len(self.memory_cache),
-            "disk_cache_size": len(self.disk_cache),
-            "redis_available": self.redis_client is not None,
-            "cache_directory": self.cache_dir,
-        }
+        if self._stats is None:
+            self._stats = CacheStats(
+                memory_cache_size=len(self.memory_cache),
+                disk_cache_size=len(self.disk_cache),
+                redis_available=self.redis_client is not None,
+                cache_directory=self.cache_dir,
+            )
+        return self._stats.to_dict()
 
     # Card-specific cache methods
     async def get_card_search_results(
@@ -187,6 +187,11 @@ class ErrorHandler:
             "retryable": self.should_retry(error, RetryConfig()),
         }
 
+    def reset_stats(self) -> None:
+        """Clear tracked error counts and timestamps"""
+        self.error_counts.clear()
+        self.last_errors.clear()
+
     def get_error_stats(self) -> Dict[str, Any]:
         """Get error statistics for monitoring"""
         return {
@@ -5,12 +5,18 @@ File export services for automatic saving of binders and decks
 import os
 import csv
 import json
+import re
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pathlib import Path
 
 from ..database.models import Binder, Deck, BinderCard, DeckCard, Card
 
+# Anything other than alphanumerics, space, "-" and "_" (\w is isalnum() plus "_")
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+# Runs of underscores/whitespace collapse to a single underscore
+_FILENAME_SEPARATOR_RUNS = re.compile(r"[_\s]+")
+
 
 class FileExportService:
     """Service for automatically exporting binders and decks to local files"""
@@ -324,17 +330,22 @@ class FileExportService:
         """
         files = []
         try:
-            for file_path in self.binders_path.glob("*.csv"):
-                stat = file_path.stat()
-                files.append(
-                    {
-                        "filename": file_path.name,
-                        "path": str(file_path),
-                        "size": stat.st_size,
-                        "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    }
-                )
+            # scandir's entries carry the file type from the directory read, so
+            # only matching files cost a stat call
+            with os.scandir(self.binders_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".csv") or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    files.append(
+                        {
+                            "filename": entry.name,
+                            "path": entry.path,
+                            "size": stat.st_size,
+                            "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                        }
+                    )
         except Exception as e:
             print(f"❌ Error listing binder files: {e}")
 
@@ -346,14 +357,17 @@ class FileExportService:
         """
         files = []
         try:
-            for file_path in self.decklists_path.glob("*"):
-                if file_path.suffix in [".ydk", ".json"]:
-                    stat = file_path.stat()
+            with os.scandir(self.decklists_path) as entries:
+                for entry in entries:
+                    suffix = os.path.splitext(entry.name)[1]
+                    if suffix not in (".ydk", ".json") or not entry.is_file():
+                        continue
+                    stat = entry.stat()
                     files.append(
                         {
-                            "filename": file_path.name,
-                            "path": str(file_path),
-                            "format": file_path.suffix[1:],  # Remove the dot
+                            "filename": entry.name,
+                            "path": entry.path,
+                            "format": suffix[1:],  # Remove the dot
                             "size": stat.st_size,
                             "created": datetime.fromtimestamp(
                                 stat.st_ctime
@@ -375,21 +389,11 @@ class FileExportService:
         if not name:
             name = "unnamed"
 
-        # Remove or replace problematic characters
-        safe_chars = []
-        for char in name:
-            if char.isalnum() or char in [" ", "-", "_"]:
-                safe_chars.append(char)
-            else:
-                safe_chars.append("_")
-
-        # Join and clean up
-        safe_name = "".join(safe_chars).strip()
+        # Replace problematic characters
+        safe_name = _UNSAFE_FILENAME_CHARS.sub("_", name).strip()
 
         # Replace multiple spaces/underscores with single ones
-        import re
-
-        safe_name = re.sub(r"[_\s]+", "_", safe_name)
+        safe_name = _FILENAME_SEPARATOR_RUNS.sub("_", safe_name)
 
         # Limit length
         if len(safe_name) > 50:
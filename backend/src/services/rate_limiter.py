@@ -4,12 +4,22 @@ Rate limiting service to prevent API abuse and respect YGOPRODeck API limits
 
 import asyncio
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import deque
+from dataclasses import dataclass, field
 import hashlib
 
 
+@dataclass(slots=True)
+class _Bucket:
+    """Rate limiting state for a single client/endpoint pair"""
+
+    requests: deque = field(default_factory=deque)
+    failure_count: int = 0
+    backoff_until: float = 0.0
+
+
 class RateLimiter:
     """
     Token bucket rate limiter with exponential backoff
@@ -27,19 +37,24 @@ class RateLimiter:
         self.backoff_factor = backoff_factor
         self.max_backoff = max_backoff
 
-        # Track requests per client/endpoint
-        self.request_history: Dict[str, deque] = defaultdict(lambda: deque())
-        self.failure_counts: Dict[str, int] = defaultdict(int)
-        self.backoff_until: Dict[str, datetime] = {}
+        # Track request history, failures and backoff per client/endpoint
+        self.buckets: Dict[Tuple[str, str], _Bucket] = {}
 
         # Global API request queue for YGOPRODeck
         self.global_request_times: deque = deque()
         self.global_failure_count = 0
         self.global_backoff_until: Optional[datetime] = None
 
-    def _get_client_key(self, client_ip: str, endpoint: str) -> str:
+    def _get_client_key(self, client_ip: str, endpoint: str) -> Tuple[str, str]:
         """Generate a key for rate limiting by client and endpoint"""
-        return f"{client_ip}:{endpoint}"
+        return (client_ip, endpoint)
+
+    def _get_or_create_bucket(self, client_key: Tuple[str, str]) -> _Bucket:
+        """Get the bucket for a client key, creating it on first write"""
+        bucket = self.buckets.get(client_key)
+        if bucket is None:
+            bucket = self.buckets[client_key] = _Bucket()
+        return bucket
 
     def _clean_old_requests(self, request_times: deque, window_seconds: int = 60):
         """Remove requests older than the time window"""
@@ -68,38 +83,37 @@ class RateLimiter:
                 self.global_backoff_until = None
                 self.global_failure_count = 0
 
-        # Check client-specific backoff
-        if client_key in self.backoff_until:
-            if current_time < self.backoff_until[client_key]:
-                retry_after = (
-                    self.backoff_until[client_key] - current_time
-                ).total_seconds()
-                return False, retry_after
-            else:
-                # Backoff period expired, reset
-                del self.backoff_until[client_key]
-                self.failure_counts[client_key] = 0
-
-        # Clean old requests
-        client_requests = self.request_history[client_key]
-        self._clean_old_requests(client_requests)
+        # No bucket means no history or backoff, so no per-client limit can be hit
+        bucket = self.buckets.get(client_key)
+        if bucket is not None:
+            # Check client-specific backoff
+            if bucket.backoff_until:
+                if now < bucket.backoff_until:
+                    return False, bucket.backoff_until - now
+                else:
+                    # Backoff period expired, reset
+                    bucket.backoff_until = 0.0
+                    bucket.failure_count = 0
+
+            # Clean old requests
+            client_requests = bucket.requests
+            self._clean_old_requests(client_requests)
+
+            # Check burst limit
+            if len(client_requests) >= self.burst_limit:
+                return False, 60.0  # Retry after 1 minute
+
+            # Check requests per minute limit
+            if len(client_requests) >= self.requests_per_minute:
+                # Calculate time until oldest request expires
+                oldest_request = client_requests[0]
+                retry_after = 60.0 - (now - oldest_request)
+                return False, max(retry_after, 1.0)
 
+        # Check global rate limit for external API
         if is_external_api:
             self._clean_old_requests(self.global_request_times)
 
-        # Check burst limit
-        if len(client_requests) >= self.burst_limit:
-            return False, 60.0  # Retry after 1 minute
-
-        # Check requests per minute limit
-        if len(client_requests) >= self.requests_per_minute:
-            # Calculate time until oldest request expires
-            oldest_request = client_requests[0]
-            retry_after = 60.0 - (now - oldest_request)
-            return False, max(retry_after, 1.0)
-
-        # Check global rate limit for external API
-        if is_external_api:
             # YGOPRODeck API allows about 20 requests per minute
             global_limit = 20
             if len(self.global_request_times) >= global_limit:
@@ -116,7 +130,7 @@ class RateLimiter:
         client_key = self._get_client_key(client_ip, endpoint)
         now = time.time()
 
-        self.request_history[client_key].append(now)
+        self._get_or_create_bucket(client_key).requests.append(now)
 
         if is_external_api:
             self.global_request_times.append(now)
@@ -127,20 +141,21 @@ class RateLimiter:
         """Record a failed request and apply exponential backoff"""
         client_key = self._get_client_key(client_ip, endpoint)
 
+        bucket = self._get_or_create_bucket(client_key)
+
         # Increment failure count
-        self.failure_counts[client_key] += 1
+        bucket.failure_count += 1
 
         if is_external_api:
             self.global_failure_count += 1
 
         # Calculate backoff time
-        failure_count = self.failure_counts[client_key]
-        backoff_seconds = min(self.backoff_factor**failure_count, self.max_backoff)
+        backoff_seconds = min(
+            self.backoff_factor**bucket.failure_count, self.max_backoff
+        )
 
         # Set backoff period
-        self.backoff_until[client_key] = datetime.now() + timedelta(
-            seconds=backoff_seconds
-        )
+        bucket.backoff_until = time.time() + backoff_seconds
 
         # Global backoff for external API failures
         if is_external_api and self.global_failure_count >= 3:
@@ -151,27 +166,30 @@ class RateLimiter:
                 seconds=global_backoff_seconds
             )
 
+    def reset(self):
+        """Clear all tracked requests, failures and backoff periods"""
+        self.buckets.clear()
+        self.global_request_times.clear()
+        self.global_failure_count = 0
+        self.global_backoff_until = None
+
     def get_stats(self) -> Dict:
         """Get rate limiting statistics"""
-        current_time = datetime.now()
-
-        # Count active rate limits
-        active_backoffs = sum(
-            1
-            for backoff_time in self.backoff_until.values()
-            if backoff_time > current_time
-        )
+        now = time.time()
 
-        # Count recent requests (last minute)
+        # Count active rate limits and recent requests (last minute)
+        active_backoffs = 0
         recent_requests = 0
-        cutoff = time.time() - 60
-        for requests in self.request_history.values():
-            recent_requests += sum(1 for req_time in requests if req_time > cutoff)
+        cutoff = now - 60
+        for bucket in self.buckets.values():
+            if bucket.backoff_until > now:
+                active_backoffs += 1
+            recent_requests += sum(1 for req_time in bucket.requests if req_time > cutoff)
 
         return {
             "requests_per_minute_limit": self.requests_per_minute,
             "burst_limit": self.burst_limit,
-            "active_clients": len(self.request_history),
+            "active_clients": len(self.buckets),
             "active_backoffs": active_backoffs,
             "recent_requests_last_minute": recent_requests,
             "global_requests_last_minute": sum(
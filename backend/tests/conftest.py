@@ -1,57 +1,123 @@
 """
 Test configuration and fixtures
 """
+import atexit
+import copy
+import os
+import shutil
+import tempfile
+
 import pytest
 import asyncio
-from httpx import AsyncClient
-from fastapi.testclient import TestClient
+from asgi_lifespan import LifespanManager
+from httpx import ASGITransport, AsyncClient
+
+# Keep the suite off the development disk cache: every test process (including
+# each xdist worker, which inherits the marker) gets its own temporary cache
+# directory before the app loads config. An explicit CACHE_PATH wins.
+if "CACHE_PATH" not in os.environ or os.environ.get("YUGIOH_TEST_CACHE_AUTO"):
+    _test_cache_dir = tempfile.mkdtemp(prefix="yugioh-test-cache-")
+    atexit.register(shutil.rmtree, _test_cache_dir, ignore_errors=True)
+    os.environ["CACHE_PATH"] = _test_cache_dir
+    os.environ["YUGIOH_TEST_CACHE_AUTO"] = "1"
+
+# Keep the suite off the development database: every test process (including
+# each xdist worker, which inherits the marker) gets its own fresh SQLite file,
+# which the app lifespan creates from the schema. An explicit DATABASE_PATH wins.
+if "DATABASE_PATH" not in os.environ or os.environ.get("YUGIOH_TEST_DB_AUTO"):
+    _test_db_dir = tempfile.mkdtemp(prefix="yugioh-test-db-")
+    atexit.register(shutil.rmtree, _test_db_dir, ignore_errors=True)
+    os.environ["DATABASE_PATH"] = os.path.join(_test_db_dir, "test.db")
+    os.environ["YUGIOH_TEST_DB_AUTO"] = "1"
 
 from src.main import app
+from src.database.models import Card
+
+try:
+    # Installed with uvicorn[standard] on platforms that support it
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+# Card seeded into the test database's card_cache, so local card search has
+# something to find in the otherwise empty per-run database
+_SAMPLE_CARD = {
+    "id": 89631139,
+    "name": "Blue-Eyes White Dragon",
+    "type": "Normal Monster",
+    "desc": "This legendary dragon is a powerful engine of destruction.",
+    "atk": 3000,
+    "def": 2500,
+    "level": 8,
+    "race": "Dragon",
+    "attribute": "LIGHT",
+    "card_images": [
+        {
+            "id": 89631139,
+            "image_url": "https://images.ygoprodeck.com/images/cards/89631139.jpg",
+            "image_url_small": "https://images.ygoprodeck.com/images/cards_small/89631139.jpg"
+        }
+    ]
+}
 
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.new_event_loop()
+    """Create an event loop for the test session, using uvloop when available."""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     yield loop
     loop.close()
 
 
-@pytest.fixture
-def test_client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+def _use_fake_redis(monkeypatch):
+    """Route cache Redis connections to fakeredis when both are installed."""
+    from src.services import cache
 
+    if fakeredis is not None and cache.REDIS_AVAILABLE:
+        monkeypatch.setattr(
+            cache.aioredis,
+            "from_url",
+            lambda *args, **kwargs: fakeredis.aioredis.FakeRedis(),
+        )
 
-@pytest.fixture
-async def async_test_client():
-    """Create an async test client for the FastAPI app."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        yield client
+
+@pytest.fixture(autouse=True)
+def fake_redis(request, monkeypatch):
+    """Point cache Redis connections at fakeredis unless a test is marked integration."""
+    if request.node.get_closest_marker("integration") is None:
+        _use_fake_redis(monkeypatch)
+    yield
+
+
+@pytest.fixture(scope="session")
+async def async_client():
+    """Create a single async client for the FastAPI app shared by the session.
+
+    The app lifespan (database setup, cache init) runs once for the whole session.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _use_fake_redis(monkeypatch)
+        async with LifespanManager(app) as manager:
+            # The lifespan has created the schema; seed the card search data
+            Card.from_api_data(_SAMPLE_CARD).save()
+            transport = ASGITransport(app=manager.app)
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                yield client
 
 
 @pytest.fixture
 def sample_card_data():
     """Sample card data for testing."""
-    return {
-        "id": 89631139,
-        "name": "Blue-Eyes White Dragon",
-        "type": "Normal Monster",
-        "desc": "This legendary dragon is a powerful engine of destruction.",
-        "atk": 3000,
-        "def": 2500,
-        "level": 8,
-        "race": "Dragon",
-        "attribute": "LIGHT",
-        "card_images": [
-            {
-                "id": 89631139,
-                "image_url": "https://images.ygoprodeck.com/images/cards/89631139.jpg",
-                "image_url_small": "https://images.ygoprodeck.com/images/cards_small/89631139.jpg"
-            }
-        ]
-    }
+    return copy.deepcopy(_SAMPLE_CARD)
 
 
 @pytest.fixture
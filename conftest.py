@@ -0,0 +1,9 @@
+"""
+Shared pytest setup for the top-level test scripts
+"""
+
+import os
+import sys
+
+# Add the backend to Python path once, so the ``src`` package resolves its relative imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
@@ -6,37 +6,234 @@ Includes built-in authentication and token management
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
 import sys
 import os
 import base64
-import getpass
 import csv
+import importlib.util
+import mmap
+import re
+import tempfile
+import time
+from types import SimpleNamespace
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+# python-dotenv is optional; the .env file is only read once something needs it
+DOTENV_AVAILABLE = importlib.util.find_spec("dotenv") is not None
+_ENV_LOADED = False
+
+
+def _load_env():
+    """Load environment variables from .env on first use"""
+    global _ENV_LOADED
+    if _ENV_LOADED or not DOTENV_AVAILABLE:
+        return
 
-# Try to load environment variables
-try:
     from dotenv import load_dotenv
 
     load_dotenv()
-    DOTENV_AVAILABLE = True
+    _ENV_LOADED = True
+
+# Prefer orjson for (de)serialization, falling back to the stdlib json module
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
 except ImportError:
-    DOTENV_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _pretty(obj: Any) -> str:
+    """Indented JSON text for log output"""
+    return _dumps(obj, indent=True).decode("utf-8")
+
+
+def _loads(data: Any) -> Any:
+    """Deserialize JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _print_json(obj: Any):
+    """Pretty-print obj as JSON, writing the encoded bytes straight to stdout"""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(_dumps(obj, indent=True).decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(_dumps(obj, indent=True) + b"\n")
+    buffer.flush()
+
+
+# Padding needed to restore an unpadded base64url segment, indexed by len % 4
+_B64_PADDING = (b"", b"===", b"==", b"=")
+
+# Payload and CSV files larger than this are read from a memory map instead of a copy
+_MMAP_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file from its raw bytes"""
+    with open(path, "rb") as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _loads(f.read())
+
+
+def _iter_mmap_lines(fileno: int) -> Iterator[str]:
+    """Yield the decoded lines of a memory-mapped file, line endings included"""
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        start = 0
+        while start < size:
+            end = mm.find(b"\n", start)
+            end = size if end == -1 else end + 1
+            yield mm[start:end].decode("utf-8")
+            start = end
+
+
+# Browser-like headers sent with every binder API request (shared, do not mutate)
+_BASE_HEADERS = {
+    "Accept": "*/*",
+    # Only the codecs urllib3 can decode here (br/zstd need brotli/zstandard)
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Content-Type": "application/json",
+    "Origin": "https://www.ygoprog.com",
+    "Sec-Ch-Ua": '"Chromium";v="140", "Not-A?Brand";v="24", "Microsoft Edge";v="140"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Windows"',
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-site",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 Edg/140.0.0.0",
+}
+
+# Status codes the binder API uses for a successful write
+_OK_STATUSES = frozenset({200, 201, 204})
+_CREATED_STATUSES = frozenset({200, 201})
+_DELETE_OK_STATUSES = frozenset({200, 204})
+
+def _build_retry() -> Retry:
+    """
+    Retry policy for the shared session: rate limiting and transient gateway
+    failures are retried on the warm pool with jittered exponential backoff,
+    honouring Retry-After. Only idempotent methods are replayed - a count-delta
+    PUT or a create POST that reached the server would otherwise be applied
+    twice; those are retried only when the connection itself failed (count
+    updates replay a 429 themselves, see update_card_count)
+    """
+    options = dict(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD", "DELETE"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(**options, backoff_jitter=0.5, backoff_max=30)
+    except TypeError:
+        # urllib3 < 2 has no jitter and a fixed backoff cap
+        return Retry(**options)
+
+
+# A rate-limited count update is sent again up to this many times; the wait
+# honours Retry-After and is capped so one card can't stall a bulk removal
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_MAX_WAIT_SECONDS = 30.0
+
+
+def _retry_after_seconds(response: requests.Response, attempt: int) -> float:
+    """
+    Seconds to wait before replaying a rate-limited request: the server's
+    Retry-After (delta-seconds or HTTP date) when present, else exponential backoff
+    """
+    value = response.headers.get("Retry-After", "")
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+            delay = (retry_at - datetime.now(retry_at.tzinfo)).total_seconds()
+        except (TypeError, ValueError):
+            delay = 2.0 ** attempt
+    return min(max(delay, 0.0), _RATE_LIMIT_MAX_WAIT_SECONDS)
+
+# How long a fetched binder is reused before it is fetched again
+_BINDER_CACHE_TTL_SECONDS = 30.0
+
+# Anything but alphanumerics, space, "-" and "_" is dropped from export filenames
+# (\w is str.isalnum() plus "_")
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+# Write buffer for CSV exports so large binders go out in big blocks
+_CSV_WRITE_BUFFER_BYTES = 1 << 20
+
+# token file path -> (mtime_ns, parsed contents) for files this process has
+# already read or written
+_TOKEN_FILE_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Treat tokens as expired this many seconds before their real expiry
+TOKEN_EXPIRY_BUFFER_SECONDS = 300
 
 
 class YGOProgAuth:
     """Handle authentication with YGOProg API"""
 
     def __init__(self, token_file: str = None):
+        _load_env()
         self.base_url = "https://api.ygoprog.com"
         self.token_file = token_file or os.getenv(
             "YGOPROG_TOKEN_FILE", "ygoprog_token.json"
         )
+        # Shared session so login and binder calls reuse one keep-alive connection;
+        # it carries the static headers and, once we have one, the bearer token
+        self.session = requests.Session()
+        self.session.headers.update(_BASE_HEADERS)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4, pool_maxsize=20, max_retries=_build_retry()
+            ),
+        )
+
         self.token = None
         self.token_data = None
+        # Resolved API endpoints (operation -> endpoint template), persisted with
+        # the token so later runs can skip endpoint probing
+        self.endpoints: Dict[str, str] = {}
         self.load_token()
 
+    def __enter__(self) -> "YGOProgAuth":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the shared HTTP session and its pooled connections"""
+        self.session.close()
+
     @classmethod
     def from_env(cls) -> "YGOProgAuth":
         """Create YGOProgAuth instance using environment variables"""
@@ -55,26 +252,57 @@ class YGOProgAuth:
 
         return instance
 
+    @property
+    def token(self) -> Optional[str]:
+        """Raw bearer token"""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]):
+        # Keep the session's Authorization header in step with the token
+        self._token = value
+        if value:
+            self.session.headers["Authorization"] = f"Bearer {value}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    @property
+    def token_data(self) -> Optional[Dict[str, Any]]:
+        """Decoded JWT payload"""
+        return self._token_data
+
+    @token_data.setter
+    def token_data(self, value: Optional[Dict[str, Any]]):
+        # Parse the expiry once so validity checks are a single float compare
+        self._token_data = value
+        exp = value.get("exp") if value else None
+        if exp:
+            self._exp_epoch = float(exp) - TOKEN_EXPIRY_BUFFER_SECONDS
+            self._expires_at_iso = datetime.fromtimestamp(exp).isoformat()
+        else:
+            self._exp_epoch = 0.0
+            self._expires_at_iso = None
+
     def login(self, username: str, password: str) -> bool:
         """Login to YGOProg and get a bearer token"""
         login_url = f"{self.base_url}/api/login"
 
         headers = {
-            "Content-Type": "application/json",
-            "Origin": "https://www.ygoprog.com",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            # Never send a stale token along with the credentials
+            "Authorization": None,
         }
 
         payload = {"username": username, "password": password}
 
         try:
             print(f"Logging in to YGOProg as {username}...")
-            response = requests.post(
-                login_url, json=payload, headers=headers, timeout=30
+            response = self.session.post(
+                login_url, data=_dumps(payload), headers=headers, timeout=30
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data.get("success"):
                     self.token = data.get("token")
                     if self.token:
@@ -91,7 +319,7 @@ class YGOProgAuth:
                 print(f"❌ Login request failed with status {response.status_code}")
                 return False
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"❌ Login request failed: {e}")
             return False
 
@@ -103,36 +331,79 @@ class YGOProgAuth:
         try:
             # Decode JWT payload
             header, payload, signature = self.token.split(".")
-            payload += "=" * (4 - len(payload) % 4)
-            payload_decoded = base64.b64decode(payload)
-            self.token_data = json.loads(payload_decoded)
-
-            # Save to file
-            token_info = {
-                "token": self.token,
-                "decoded": self.token_data,
-                "saved_at": datetime.now().isoformat(),
-            }
-
-            with open(self.token_file, "w") as f:
-                json.dump(token_info, f, indent=2)
+            payload_decoded = base64.urlsafe_b64decode(
+                payload.encode("ascii") + _B64_PADDING[len(payload) & 3]
+            )
+            self.token_data = _loads(payload_decoded)
 
+            self._save_token_file()
             print(f"Token saved to {self.token_file}")
 
         except Exception as e:
             print(f"Warning: Could not decode/save token: {e}")
 
+    def _save_token_file(self):
+        """Write the token, its decoded payload and resolved endpoints to the token file"""
+        token_info = {
+            "token": self.token,
+            "decoded": self.token_data,
+            "saved_at": datetime.now().isoformat(),
+            "endpoints": self.endpoints,
+        }
+
+        # Serialize up front, write once to a private temp file, then atomically
+        # swap it into place
+        data = _dumps(token_info, indent=True)
+        token_dir = os.path.dirname(os.path.abspath(self.token_file))
+        fd, tmp_file = tempfile.mkstemp(dir=token_dir, suffix=".tmp")
+        try:
+            os.chmod(tmp_file, 0o600)
+            with os.fdopen(fd, "wb", buffering=len(data) + 1) as f:
+                f.write(data)
+            os.replace(tmp_file, self.token_file)
+            token_info["endpoints"] = dict(self.endpoints)
+            _TOKEN_FILE_CACHE[self.token_file] = (
+                os.stat(self.token_file).st_mtime_ns,
+                token_info,
+            )
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+
+    def remember_endpoint(self, operation: str, endpoint: str):
+        """Record the endpoint that worked for an operation, persisting it with the token"""
+        if self.endpoints.get(operation) == endpoint:
+            return
+
+        self.endpoints[operation] = endpoint
+        if self.token:
+            try:
+                self._save_token_file()
+            except OSError as e:
+                print(f"Warning: Could not save resolved endpoints: {e}")
+
     def load_token(self):
         """Load token from file if it exists and is valid"""
-        if not os.path.exists(self.token_file):
+        try:
+            mtime = os.stat(self.token_file).st_mtime_ns
+        except OSError:
             return
 
         try:
-            with open(self.token_file, "r") as f:
-                token_info = json.load(f)
+            # Reuse the parsed file if this process already read or wrote this
+            # exact version of it
+            cached = _TOKEN_FILE_CACHE.get(self.token_file)
+            if cached and cached[0] == mtime:
+                token_info = cached[1]
+            else:
+                with open(self.token_file, "rb") as f:
+                    token_info = _loads(f.read())
+                _TOKEN_FILE_CACHE[self.token_file] = (mtime, token_info)
 
             self.token = token_info.get("token")
             self.token_data = token_info.get("decoded")
+            self.endpoints = dict(token_info.get("endpoints") or {})
 
             if self.is_token_valid():
                 print(f"✅ Loaded valid token from {self.token_file}")
@@ -146,18 +417,7 @@ class YGOProgAuth:
 
     def is_token_valid(self) -> bool:
         """Check if current token is valid and not expired"""
-        if not self.token or not self.token_data:
-            return False
-
-        exp = self.token_data.get("exp")
-        if not exp:
-            return False
-
-        expires_at = datetime.fromtimestamp(exp)
-        now = datetime.now()
-        buffer = timedelta(minutes=5)
-
-        return expires_at > (now + buffer)
+        return bool(self.token) and time.time() < self._exp_epoch
 
     def get_token(self) -> Optional[str]:
         """Get current valid token"""
@@ -173,16 +433,18 @@ class YGOProgAuth:
         exp = self.token_data.get("exp")
         iat = self.token_data.get("iat")
 
+        # One clock read serves both the validity flag and the countdown
+        now = time.time()
         info = {
             "username": self.token_data.get("username"),
             "user_id": self.token_data.get("userId"),
-            "valid": self.is_token_valid(),
+            "valid": bool(self.token) and now < self._exp_epoch,
         }
 
         if exp:
-            expires_at = datetime.fromtimestamp(exp)
-            info["expires_at"] = expires_at.isoformat()
-            info["expires_in"] = str(expires_at - datetime.now())
+            remaining = self._exp_epoch + TOKEN_EXPIRY_BUFFER_SECONDS - now
+            info["expires_at"] = self._expires_at_iso
+            info["expires_in"] = str(timedelta(seconds=max(0.0, remaining)))
 
         if iat:
             info["issued_at"] = datetime.fromtimestamp(iat).isoformat()
@@ -204,9 +466,97 @@ class YGOProgAuth:
 class YGOProgBinder:
     """Handle binder operations with YGOProg API"""
 
-    def __init__(self, auth: YGOProgAuth):
+    # Keys that may hold the binder list when the response is wrapped in an object
+    _BINDER_LIST_KEYS = ("binders", "data", "results")
+
+    def __init__(self, auth: YGOProgAuth, verbose: bool = False):
         self.auth = auth
         self.base_url = "https://api.ygoprog.com"
+        # Pretty-print request/response bodies (debugging aid); YGOPROG_VERBOSE=1
+        # turns it on without the CLI flag
+        self.verbose = verbose or os.getenv("YGOPROG_VERBOSE") == "1"
+        # Fixed endpoint URL templates, built once; fill in with .format(binder_id)
+        self._urls = SimpleNamespace(
+            binder=self.base_url + "/api/binder/{}",
+            binder_cards=self.base_url + "/api/binder/{}/cards",
+            card_count=self.base_url + "/api/binder/{}/card/count",
+        )
+        # binder_id -> (monotonic fetch time, binder data)
+        self._binder_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # binder_id -> (binder data it was built from, card lookup indexes)
+        self._card_index_cache: Dict[str, Tuple[Dict[str, Any], Tuple[Dict, Dict]]] = {}
+        # operation -> endpoint template that last succeeded for it (shared with
+        # auth so it is saved alongside the token)
+        self._endpoint_cache = auth.endpoints
+
+    def _candidate_endpoints(self, operation: str, candidates: List[str]) -> List[str]:
+        """Order endpoint templates so the last one that worked is tried first"""
+        resolved = self._endpoint_cache.get(operation)
+        if resolved not in candidates:
+            return candidates
+        return [resolved] + [c for c in candidates if c != resolved]
+
+    def _get_or_error(self, endpoint: str):
+        """GET an API endpoint, returning the exception instead of raising it"""
+        try:
+            return self.auth.session.get(self.base_url + endpoint, timeout=30)
+        except requests.exceptions.RequestException as e:
+            return e
+
+    def _probe_get_endpoints(
+        self, operation: str, candidates: List[str]
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        GET candidate endpoints, yielding (endpoint, response or exception) in
+        preference order. The remembered endpoint is requested on its own; any
+        others are requested together so a full probe costs one round-trip
+        """
+        endpoints = self._candidate_endpoints(operation, candidates)
+        if endpoints[0] == self._endpoint_cache.get(operation):
+            yield endpoints[0], self._get_or_error(endpoints[0])
+            endpoints = endpoints[1:]
+        if not endpoints:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=len(endpoints))
+        try:
+            futures = [executor.submit(self._get_or_error, e) for e in endpoints]
+            for endpoint, future in zip(endpoints, futures):
+                yield endpoint, future.result()
+        finally:
+            executor.shutdown(wait=False)
+
+    def _invalidate_binder(self, binder_id: str):
+        """Drop a binder from the contents cache after it has been modified"""
+        self._binder_cache.pop(binder_id, None)
+        self._card_index_cache.pop(binder_id, None)
+
+    @staticmethod
+    def _index_cards(
+        cards: List[Dict[str, Any]]
+    ) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """Index cards by (code, rarity) and by code, keeping the first match"""
+        by_code_rarity: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        by_code: Dict[str, List[Dict[str, Any]]] = {}
+        for card in cards:
+            code = card.get("code", "")
+            by_code_rarity.setdefault((code, card.get("rarity", "")), card)
+            by_code.setdefault(code, []).append(card)
+        return by_code_rarity, by_code
+
+    def _get_card_index(
+        self, binder_id: str
+    ) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """Get card lookup indexes for a binder, rebuilt only when its contents change"""
+        binder_data = self.get_binder_contents(binder_id)
+        cached = self._card_index_cache.get(binder_id)
+        if cached and cached[0] is binder_data:
+            return cached[1]
+
+        index = self._index_cards(binder_data.get("cards", []))
+        if binder_data:
+            self._card_index_cache[binder_id] = (binder_data, index)
+        return index
 
     def get_user_binders(self) -> List[Dict[str, Any]]:
         """
@@ -218,34 +568,38 @@ class YGOProgBinder:
             return []
 
         # Try common endpoints for getting user binders
-        possible_endpoints = [
-            "/api/binders",
-            "/api/user/binders",
-            "/api/binder",
-            "/api/me/binders",
-        ]
-
-        headers = self._get_api_headers()
+        probes = self._probe_get_endpoints(
+            "get_user_binders",
+            [
+                "/api/binders",
+                "/api/user/binders",
+                "/api/binder",
+                "/api/me/binders",
+            ],
+        )
 
-        for endpoint in possible_endpoints:
-            url = f"{self.base_url}{endpoint}"
+        for endpoint, response in probes:
+            print(f"Trying endpoint: {endpoint}")
+            if isinstance(response, Exception):
+                print(f"Error trying {endpoint}: {response}")
+                continue
             try:
-                print(f"Trying endpoint: {endpoint}")
-                response = requests.get(url, headers=headers, timeout=30)
-
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _loads(response.content)
                     print(f"✅ Found binders endpoint: {endpoint}")
-                    print(f"Raw response: {json.dumps(data, indent=2)[:500]}...")
+                    self.auth.remember_endpoint("get_user_binders", endpoint)
+                    if self.verbose:
+                        print(f"Raw response: {_pretty(data)[:500]}...")
 
                     # Handle different response formats
                     if isinstance(data, list):
                         return data
                     elif isinstance(data, dict):
                         # Check common keys for binder lists
-                        for key in ["binders", "data", "results"]:
-                            if key in data and isinstance(data[key], list):
-                                return data[key]
+                        for key in self._BINDER_LIST_KEYS:
+                            binders = data.get(key)
+                            if isinstance(binders, list):
+                                return binders
                         # If it's a single binder object, wrap in list
                         if "name" in data or "_id" in data:
                             return [data]
@@ -262,31 +616,41 @@ class YGOProgBinder:
                         f"Endpoint {endpoint} returned {response.status_code}: {response.text[:200]}"
                     )
 
-            except requests.exceptions.RequestException as e:
+            except ValueError as e:
                 print(f"Error trying {endpoint}: {e}")
                 continue
 
         print("❌ Could not find working binders endpoint")
         return []
 
-    def get_binder_contents(self, binder_id: str) -> Dict[str, Any]:
+    def get_binder_contents(self, binder_id: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Get contents of a specific binder
+        Reuses a copy fetched within the last few seconds unless refresh is set
         """
         if not self.auth.is_token_valid():
             print("❌ No valid authentication token")
             return {}
 
-        url = f"{self.base_url}/api/binder/{binder_id}"
-        headers = self._get_api_headers()
+        cached = self._binder_cache.get(binder_id)
+        if (
+            cached
+            and not refresh
+            and time.monotonic() - cached[0] < _BINDER_CACHE_TTL_SECONDS
+        ):
+            return cached[1]
+
+        url = self._urls.binder.format(binder_id)
 
         try:
             print(f"Fetching binder contents for ID: {binder_id}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.auth.session.get(url, timeout=30)
 
             if response.status_code == 200:
-                data = response.json()
+                # Parse straight from the raw bytes, skipping the decoded str copy
+                data = _loads(response.content)
                 print("✅ Successfully retrieved binder contents")
+                self._binder_cache[binder_id] = (time.monotonic(), data)
                 return data
             elif response.status_code == 404:
                 print(f"❌ Binder not found: {binder_id}")
@@ -298,6 +662,8 @@ class YGOProgBinder:
 
         except requests.exceptions.RequestException as e:
             print(f"❌ Request failed: {e}")
+        except ValueError as e:
+            print(f"❌ Invalid JSON in binder response: {e}")
 
         return {}
 
@@ -318,28 +684,26 @@ class YGOProgBinder:
         if not filename:
             binder_name = binder_data.get("name", "unknown_binder")
             # Clean filename
-            safe_name = "".join(
-                c for c in binder_name if c.isalnum() or c in (" ", "-", "_")
-            ).rstrip()
+            safe_name = _UNSAFE_FILENAME_CHARS.sub("", binder_name).rstrip()
             filename = f"{safe_name}_{binder_id[:8]}.csv"
 
         try:
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+            with open(
+                filename, "w", newline="", encoding="utf-8",
+                buffering=_CSV_WRITE_BUFFER_BYTES,
+            ) as csvfile:
                 # Determine fieldnames from first card
                 if cards:
-                    # Get all unique field names from all cards
-                    all_fieldnames = set()
-                    for card in cards:
-                        all_fieldnames.update(card.keys())
-                    
-                    # Convert to list and sort for consistency
-                    fieldnames = sorted(list(all_fieldnames))
+                    # Get all unique field names from all cards, in first-seen order
+                    fieldnames = list(
+                        dict.fromkeys(key for card in cards for key in card)
+                    )
                     
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-
-                    for card in cards:
-                        writer.writerow(card)
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    writer.writerows(
+                        [card.get(field, "") for field in fieldnames] for card in cards
+                    )
 
                     print(f"✅ Exported {len(cards)} cards to {filename}")
                     return True
@@ -350,19 +714,6 @@ class YGOProgBinder:
 
         return False
 
-    def _get_api_headers(self) -> Dict[str, str]:
-        """Get headers for API requests"""
-        return {
-            "Accept": "*/*",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Content-Type": "application/json",
-            "Host": "api.ygoprog.com",
-            "Origin": "https://www.ygoprog.com",
-            "Authorization": f"Bearer {self.auth.get_token()}",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        }
-
     def update_binder_cards(self, binder_id: str, cards: List[Dict[str, Any]], method: str = "PUT") -> bool:
         """
         Update cards in a YGOProg binder - try different HTTP methods
@@ -372,14 +723,17 @@ class YGOProgBinder:
             return False
 
         # Try different possible endpoints and methods
-        endpoints_to_try = [
-            f"/api/binder/{binder_id}/cards",
-            f"/api/binder/{binder_id}",
-            f"/api/user/binder/{binder_id}/cards",
-            f"/api/user/binder/{binder_id}",
-        ]
+        operation = f"update_binder_cards:{method.upper()}"
+        endpoints_to_try = self._candidate_endpoints(
+            operation,
+            [
+                "/api/binder/{binder_id}/cards",
+                "/api/binder/{binder_id}",
+                "/api/user/binder/{binder_id}/cards",
+                "/api/user/binder/{binder_id}",
+            ],
+        )
         
-        headers = self._get_api_headers()
         payload = {"cards": cards}
         
         # If updating the whole binder, include additional fields
@@ -393,34 +747,41 @@ class YGOProgBinder:
                     "_id": binder_id
                 })
 
-        for endpoint in endpoints_to_try:
-            url = f"{self.base_url}{endpoint}"
+        for endpoint_template in endpoints_to_try:
+            endpoint = endpoint_template.format(binder_id=binder_id)
+            url = self.base_url + endpoint
             try:
                 print(f"Trying {method} request to {endpoint}")
                 print(f"📤 Sending payload with {len(cards)} cards")
                 
-                if len(cards) <= 3:
-                    print(f"📋 Sample payload: {json.dumps(payload, indent=2)}")
+                if self.verbose and len(cards) <= 3:
+                    print(f"📋 Sample payload: {_pretty(payload)}")
                 
                 # Try the specified HTTP method
                 if method.upper() == "PUT":
-                    response = requests.put(url, json=payload, headers=headers, timeout=30)
+                    response = self.auth.session.put(url, data=_dumps(payload), timeout=30)
                 elif method.upper() == "PATCH":
-                    response = requests.patch(url, json=payload, headers=headers, timeout=30)
+                    response = self.auth.session.patch(url, data=_dumps(payload), timeout=30)
                 elif method.upper() == "POST":
-                    response = requests.post(url, json=payload, headers=headers, timeout=30)
+                    response = self.auth.session.post(url, data=_dumps(payload), timeout=30)
                 else:
                     print(f"❌ Unsupported HTTP method: {method}")
                     continue
 
                 print(f"📡 Response status: {response.status_code}")
                 
-                if response.status_code in [200, 201, 204]:
+                if response.status_code in _OK_STATUSES:
                     print(f"✅ SUCCESS with {method} to {endpoint}")
+                    self._invalidate_binder(binder_id)
+                    self.auth.remember_endpoint(operation, endpoint_template)
                     try:
-                        response_data = response.json()
+                        response_data = _loads(response.content)
                         # Check if the response shows the expected number of cards
                         returned_cards = response_data.get("cards", [])
+                        if "cards" in response_data:
+                            # The server echoed the binder back; reuse it as the
+                            # fresh snapshot instead of re-fetching to verify
+                            self._binder_cache[binder_id] = (time.monotonic(), response_data)
                         print(f"� Server reports {len(returned_cards)} cards in binder")
                         
                         if len(returned_cards) == len(cards):
@@ -462,32 +823,37 @@ class YGOProgBinder:
             return None
 
         # Try different possible endpoints for creating binders
-        possible_endpoints = [
-            f"/api/binder/{name}",  # Based on browser dev tools showing POST to /api/binder/test5
-            "/api/binder",
-            "/api/binders",
-            "/api/user/binder",
-            "/api/user/binders",
-        ]
+        possible_endpoints = self._candidate_endpoints(
+            "create_binder",
+            [
+                "/api/binder/{name}",  # Based on browser dev tools showing POST to /api/binder/test5
+                "/api/binder",
+                "/api/binders",
+                "/api/user/binder",
+                "/api/user/binders",
+            ],
+        )
         
-        headers = self._get_api_headers()
         payload = {
             "name": name,
             "description": description,
             "cards": []
         }
 
-        for endpoint in possible_endpoints:
-            url = f"{self.base_url}{endpoint}"
+        for endpoint_template in possible_endpoints:
+            endpoint = endpoint_template.format(name=name)
+            url = self.base_url + endpoint
             try:
                 print(f"Trying to create binder at endpoint: {endpoint}")
-                response = requests.post(url, json=payload, headers=headers, timeout=30)
+                response = self.auth.session.post(url, data=_dumps(payload), timeout=30)
 
-                if response.status_code == 201 or response.status_code == 200:
-                    data = response.json()
+                if response.status_code in _CREATED_STATUSES:
+                    data = _loads(response.content)
                     print(f"✅ Found working create endpoint: {endpoint}")
+                    self.auth.remember_endpoint("create_binder", endpoint_template)
                     binder_id = data.get("_id") or data.get("id")
                     if binder_id:
+                        self._invalidate_binder(binder_id)
                         print(f"✅ Binder '{name}' created successfully! ID: {binder_id}")
                         return binder_id
                     else:
@@ -503,7 +869,7 @@ class YGOProgBinder:
                     print(f"Endpoint {endpoint} returned {response.status_code}: {response.text[:200]}")
                     continue
 
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
                 print(f"Error trying {endpoint}: {e}")
                 continue
 
@@ -518,23 +884,23 @@ class YGOProgBinder:
             print("❌ No valid authentication token")
             return False
 
-        url = f"{self.base_url}/api/binder/{binder_id}"
-        headers = self._get_api_headers()
+        url = self._urls.binder.format(binder_id)
 
         try:
             print(f"🗑️ Deleting binder {binder_id}...")
             print(f"📤 Sending DELETE request to {url}")
-            response = requests.delete(url, headers=headers, timeout=30)
+            response = self.auth.session.delete(url, timeout=30)
 
             print(f"📡 Response status: {response.status_code}")
             
-            if response.status_code == 200 or response.status_code == 204:
-                try:
-                    if response.text:
-                        response_data = response.json()
-                        print(f"📡 Response: {json.dumps(response_data, indent=2)}")
-                except:
-                    print(f"📡 Response text: {response.text}")
+            if response.status_code in _DELETE_OK_STATUSES:
+                if self.verbose and response.content:
+                    try:
+                        response_data = _loads(response.content)
+                        print(f"📡 Response: {_pretty(response_data)}")
+                    except ValueError:
+                        print(f"📡 Response text: {response.text}")
+                self._invalidate_binder(binder_id)
                 print("✅ Binder deleted successfully!")
                 return True
             elif response.status_code == 401:
@@ -571,12 +937,13 @@ class YGOProgBinder:
             return False
 
         # Remove the specified cards
+        targets = frozenset(name.lower() for name in card_names)
         cards_to_keep = []
         removed_count = 0
         
         for card in current_cards:
             card_name = card.get("name", "").lower()
-            if any(target_name.lower() == card_name for target_name in card_names):
+            if card_name in targets:
                 removed_count += 1
                 print(f"🗑️ Removing: {card.get('name')}")
             else:
@@ -599,8 +966,7 @@ class YGOProgBinder:
             print("❌ No valid authentication token")
             return False
 
-        url = f"{self.base_url}/api/binder/{binder_id}/card/count"
-        headers = self._get_api_headers()
+        url = self._urls.card_count.format(binder_id)
         payload = {
             "code": card_code,
             "rarity": rarity,
@@ -610,23 +976,38 @@ class YGOProgBinder:
         try:
             print(f"Updating card count: {card_code} ({rarity}) by {count_delta}")
             print(f"📤 Sending to {url}")
-            print(f"📋 Payload: {json.dumps(payload, indent=2)}")
+            if self.verbose:
+                print(f"📋 Payload: {_pretty(payload)}")
             
-            response = requests.put(url, json=payload, headers=headers, timeout=30)
+            body = _dumps(payload)
+            for attempt in range(_RATE_LIMIT_RETRIES + 1):
+                response = self.auth.session.put(url, data=body, timeout=30)
+                if response.status_code != 429 or attempt == _RATE_LIMIT_RETRIES:
+                    break
+                # A 429 means the delta was not applied, so sending it again is safe
+                delay = _retry_after_seconds(response, attempt)
+                print(f"⏳ Rate limited, retrying in {delay:.1f}s...")
+                time.sleep(delay)
             
             print(f"📡 Response status: {response.status_code}")
             
             if response.status_code == 200:
-                try:
-                    response_data = response.json()
-                    print(f"📡 Response: {json.dumps(response_data, indent=2)}")
-                except:
-                    print(f"📡 Response text: {response.text}")
+                if self.verbose:
+                    try:
+                        response_data = _loads(response.content)
+                        print(f"📡 Response: {_pretty(response_data)}")
+                    except:
+                        print(f"📡 Response text: {response.text}")
+                self._invalidate_binder(binder_id)
                 print("✅ Card count updated successfully!")
                 return True
             elif response.status_code == 401:
                 print("❌ Authentication failed - token may be expired")
                 return False
+            elif response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "unknown")
+                print(f"❌ Rate limited (Retry-After: {retry_after})")
+                return False
             else:
                 print(f"❌ Update failed with status {response.status_code}")
                 print(f"Response: {response.text}")
@@ -636,6 +1017,17 @@ class YGOProgBinder:
             print(f"❌ Request failed: {e}")
             return False
 
+    def update_card_counts(
+        self, binder_id: str, updates: List[Tuple[str, str, int]]
+    ) -> List[bool]:
+        """
+        Apply several (card_code, rarity, count_delta) updates one at a time
+        Deltas against the same binder are not atomic on the server, so they
+        are never sent concurrently
+        Returns one success flag per update, in the same order
+        """
+        return [self.update_card_count(binder_id, *update) for update in updates]
+
     def remove_card_by_code(self, binder_id: str, card_code: str, rarity: str = None) -> bool:
         """
         Remove a card from binder by setting its count to 0 using the card/count endpoint
@@ -646,37 +1038,36 @@ class YGOProgBinder:
 
         # If no rarity specified, try to find the card in the binder first
         if not rarity:
-            binder_data = self.get_binder_contents(binder_id)
-            cards = binder_data.get("cards", [])
+            _, cards_by_code = self._get_card_index(binder_id)
             
-            matching_cards = [card for card in cards if card.get("code", "") == card_code]
+            matching_cards = cards_by_code.get(card_code, [])
             if not matching_cards:
                 print(f"❌ Card with code {card_code} not found in binder")
                 return False
             
             # If multiple rarities exist, remove all of them
+            to_remove = [card for card in matching_cards if card.get("count", 0) > 0]
+            # Use negative count to remove all copies
+            results = self.update_card_counts(
+                binder_id,
+                [
+                    (card_code, card.get("rarity", "Common"), -card.get("count", 0))
+                    for card in to_remove
+                ],
+            )
+
             success_count = 0
-            for card in matching_cards:
-                card_rarity = card.get("rarity", "Common")
-                current_count = card.get("count", 0)
-                if current_count > 0:
-                    # Use negative count to remove all copies
-                    if self.update_card_count(binder_id, card_code, card_rarity, -current_count):
-                        success_count += 1
-                        print(f"✅ Removed {current_count}x {card.get('name', 'Unknown')} ({card_rarity})")
+            for card, ok in zip(to_remove, results):
+                if ok:
+                    success_count += 1
+                    print(f"✅ Removed {card.get('count', 0)}x {card.get('name', 'Unknown')} ({card.get('rarity', 'Common')})")
             
             return success_count > 0
         else:
             # Get current count first
-            binder_data = self.get_binder_contents(binder_id)
-            cards = binder_data.get("cards", [])
-            
-            target_card = None
-            for card in cards:
-                if card.get("code", "") == card_code and card.get("rarity", "") == rarity:
-                    target_card = card
-                    break
+            cards_by_code_rarity, _ = self._get_card_index(binder_id)
             
+            target_card = cards_by_code_rarity.get((card_code, rarity))
             if not target_card:
                 print(f"❌ Card {card_code} ({rarity}) not found in binder")
                 return False
@@ -700,15 +1091,9 @@ class YGOProgBinder:
 
         # Get current binder contents to find the card
         print(f"🔍 Looking for card {card_code} ({rarity}) in binder...")
-        binder_data = self.get_binder_contents(binder_id)
-        cards = binder_data.get("cards", [])
-        
-        target_card = None
-        for card in cards:
-            if card.get("code", "") == card_code and card.get("rarity", "") == rarity:
-                target_card = card
-                break
+        cards_by_code_rarity, _ = self._get_card_index(binder_id)
         
+        target_card = cards_by_code_rarity.get((card_code, rarity))
         if not target_card:
             print(f"❌ Card {card_code} ({rarity}) not found in binder")
             return False
@@ -727,7 +1112,8 @@ class YGOProgBinder:
 
     def remove_all_cards_from_binder(self, binder_id: str) -> bool:
         """
-        Remove all cards from a binder by setting each card's count to 0 using the card/count endpoint
+        Remove all cards from a binder with a single empty-list PUT, falling back to
+        setting each card's count to 0 using the card/count endpoint
         (This clears the binder contents but keeps the binder itself)
         """
         if not self.auth.is_token_valid():
@@ -744,8 +1130,29 @@ class YGOProgBinder:
         
         print(f"🗑️ Removing all cards from binder (keeping binder itself)...")
         print(f"📊 Found {len(cards)} card types to remove")
-        
-        success_count = 0
+
+        # One PUT with an empty card list clears everything in a single request.
+        # It can report success without clearing anything (e.g. a non-JSON
+        # reply), so check the binder afterwards like clear_binder does
+        self.update_binder_cards(binder_id, [], method="PUT")
+        binder_data = self.get_binder_contents(binder_id)
+        if not binder_data:
+            print("⚠️ Could not verify the bulk clear, removing cards individually")
+            remaining = cards
+        else:
+            remaining = binder_data.get("cards", [])
+            if not remaining:
+                print("✅ Binder cleared with a single request")
+                return True
+            print(f"Bulk clear left {len(remaining)} card types, falling back to per-card count updates...")
+
+        return self._zero_card_counts(binder_id, remaining)
+
+    def _zero_card_counts(self, binder_id: str, cards: List[Dict[str, Any]]) -> bool:
+        """
+        Set the count of each given card to 0 using the card/count endpoint
+        """
+        updates = []
         error_count = 0
         
         for i, card in enumerate(cards, 1):
@@ -764,23 +1171,19 @@ class YGOProgBinder:
                 continue
             
             print(f"[{i}/{len(cards)}] Removing {current_count}x {card_name} ({card_code})")
-            
-            if self.update_card_count(binder_id, card_code, card_rarity, -current_count):
-                success_count += 1
-            else:
-                error_count += 1
-                
-            # Longer delay to avoid overwhelming the API
-            import time
-            if i < len(cards):  # Don't sleep after the last card
-                print(f"⏳ Waiting 10 seconds before next request...")
-                time.sleep(10)
+            updates.append((card_code, card_rarity, -current_count))
+
+        results = self.update_card_counts(binder_id, updates)
+        success_count = sum(results)
+        error_count += len(results) - success_count
+
         print(f"📊 Results: {success_count} successful, {error_count} failed")
         return error_count == 0
 
     def clear_binder(self, binder_id: str) -> bool:
         """
-        Remove all cards from a binder - try the new card/count method first
+        Remove all cards from a binder - one bulk PUT first, per-card removal
+        only for whatever survives it
         """
         if not self.auth.is_token_valid():
             print("❌ No valid authentication token")
@@ -788,20 +1191,21 @@ class YGOProgBinder:
 
         print(f"🗑️ Clearing all cards from binder {binder_id}...")
         
-        # Method 1: Try the new card/count approach
-        print("Method 1: Using individual card/count operations...")
-        if self.remove_all_cards_from_binder(binder_id):
-            print("✅ Binder cleared successfully using card/count method!")
+        # Method 1: PUT with empty cards array, then verify. Every mutation drops
+        # the cached snapshot (or replaces it with the server's echo), so the
+        # verify reads only hit the network when something actually changed
+        print("Method 1: Trying PUT with empty cards array...")
+        self.update_binder_cards(binder_id, [])
+        binder_data = self.get_binder_contents(binder_id)
+        current_cards = binder_data.get("cards", [])
+        if len(current_cards) == 0:
+            print("✅ Binder cleared successfully using method 1!")
             return True
+        print(f"❌ Method 1 failed - still has {len(current_cards)} cards")
         
-        # Fallback to old methods if the new one fails
-        print("Method 1 failed, trying fallback methods...")
-        
-        # Method 2: Try to update with empty card list
-        print("Method 2: Trying PUT with empty cards array...")
-        success = self.update_binder_cards(binder_id, [])
-        if success:
-            # Verify it actually worked
+        # Method 2: Per-card count updates, only for the cards that remain
+        print("Method 2: Removing remaining cards individually...")
+        if self._zero_card_counts(binder_id, current_cards):
             binder_data = self.get_binder_contents(binder_id)
             current_cards = binder_data.get("cards", [])
             if len(current_cards) == 0:
@@ -813,12 +1217,12 @@ class YGOProgBinder:
         # Method 3: Try DELETE request on cards endpoint
         print("Method 3: Trying DELETE request...")
         try:
-            url = f"{self.base_url}/api/binder/{binder_id}/cards"
-            headers = self._get_api_headers()
-            response = requests.delete(url, headers=headers, timeout=30)
+            url = self._urls.binder_cards.format(binder_id)
+            response = self.auth.session.delete(url, timeout=30)
             
-            if response.status_code in [200, 204]:
+            if response.status_code in _DELETE_OK_STATUSES:
                 print("✅ DELETE request successful!")
+                self._invalidate_binder(binder_id)
                 # Verify
                 binder_data = self.get_binder_contents(binder_id)
                 current_cards = binder_data.get("cards", [])
@@ -835,6 +1239,92 @@ class YGOProgBinder:
         print("❌ All clear methods failed")
         return False
 
+    def iter_csv_cards(self, csv_file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Parse a binder CSV file lazily, yielding one YGOProg card dict per valid row
+        Expects CSV format: cardname,cardq,cardid,cardrarity,cardcondition,card_edition,cardset,cardcode
+        """
+        with open(csv_file_path, 'r', encoding='utf-8', newline='') as csvfile:
+            lines = csvfile
+            if os.fstat(csvfile.fileno()).st_size > _MMAP_THRESHOLD_BYTES:
+                # Split very large files on the mapped bytes instead of
+                # going through the text layer's line buffering
+                lines = _iter_mmap_lines(csvfile.fileno())
+            reader = csv.reader(lines)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            # Resolve column positions once; absent columns point at a padding
+            # slot past the end of the header so they read as ""
+            width = len(header)
+            columns = {name: i for i, name in enumerate(header)}
+            name_i, cardid_i, count_i, rarity_i, set_i, code_i = (
+                columns.get(column, width)
+                for column in (
+                    "cardname", "cardid", "cardq", "cardrarity", "cardset", "cardcode"
+                )
+            )
+            padding = [""] * (width + 1)
+            
+            # Malformed rows are tallied and reported once after the file is read;
+            # the per-row detail is only printed in verbose mode
+            skipped = Counter()
+            row_num = 0
+            for row in reader:
+                if not row:
+                    continue
+                row_num += 1
+                if len(row) <= width:
+                    row.extend(padding[len(row):])
+
+                # Extract and validate data
+                name = row[name_i].strip()
+                cardid_str = row[cardid_i].strip()
+                count_str = row[count_i].strip()
+                rarity = row[rarity_i].strip()
+                card_set = row[set_i].strip()
+                code = row[code_i].strip()
+                
+                # Validate required fields
+                if not name:
+                    skipped["missing card name"] += 1
+                    if self.verbose:
+                        print(f"⚠️ Row {row_num}: Missing card name, skipping")
+                    continue
+                    
+                # Parse numbers directly (EAFP) rather than scanning with isdigit first
+                try:
+                    cardid = int(cardid_str)
+                except ValueError:
+                    cardid = -1
+                if cardid < 0:
+                    skipped["invalid card ID"] += 1
+                    if self.verbose:
+                        print(f"⚠️ Row {row_num}: Invalid card ID for '{name}', skipping")
+                    continue
+                
+                try:
+                    count = int(count_str)
+                except ValueError:
+                    count = 1
+                if count < 0:
+                    count = 1
+                
+                # Map CSV columns to YGOProg format - ensure all strings are non-null
+                yield {
+                    "name": name,
+                    "cardId": cardid,  # Note: YGOProg uses "cardId", not "cardid"
+                    "count": count,
+                    "rarity": rarity or "Unknown",
+                    "set": card_set or "Unknown",
+                    "code": code,
+                }
+
+            if skipped:
+                reasons = ", ".join(f"{n} {reason}" for reason, n in skipped.items())
+                print(f"⚠️ Skipped {sum(skipped.values())} of {row_num} rows ({reasons})")
+
     def import_csv_to_binder(self, csv_file_path: str, binder_id: str) -> bool:
         """
         Import cards from a CSV file to a binder
@@ -846,49 +1336,27 @@ class YGOProgBinder:
 
         try:
             print(f"Reading CSV file: {csv_file_path}")
-            cards = []
-            
-            with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                for row_num, row in enumerate(reader, 1):
-                    # Extract and validate data
-                    name = row.get("cardname", "").strip()
-                    cardid_str = row.get("cardid", "").strip()
-                    count_str = row.get("cardq", "1").strip()
-                    rarity = row.get("cardrarity", "").strip()
-                    card_set = row.get("cardset", "").strip()
-                    code = row.get("cardcode", "").strip()
-                    
-                    # Validate required fields
-                    if not name:
-                        print(f"⚠️ Row {row_num}: Missing card name, skipping")
-                        continue
-                        
-                    if not cardid_str or not cardid_str.isdigit():
-                        print(f"⚠️ Row {row_num}: Invalid card ID for '{name}', skipping")
-                        continue
-                    
-                    cardid = int(cardid_str)
-                    count = int(count_str) if count_str.isdigit() else 1
-                    
-                    # Map CSV columns to YGOProg format - ensure all strings are non-null
-                    card = {
-                        "name": name,
-                        "cardId": cardid,  # Note: YGOProg uses "cardId", not "cardid"
-                        "count": count,
-                        "rarity": rarity if rarity else "Unknown",
-                        "set": card_set if card_set else "Unknown",
-                        "code": code if code else ""
-                    }
-                    
-                    cards.append(card)
+            # Rows for the same printing (e.g. split by condition) are merged
+            # into one entry with the counts summed, so each card is sent once
+            merged: Dict[Tuple[int, str, str, str], Dict[str, Any]] = {}
+            row_count = 0
+            for card in self.iter_csv_cards(csv_file_path):
+                row_count += 1
+                key = (card["cardId"], card["rarity"], card["set"], card["code"])
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = card
+                else:
+                    existing["count"] += card["count"]
+            cards = list(merged.values())
 
             if not cards:
                 print("❌ No valid cards found in CSV file")
                 return False
 
             print(f"📥 Parsed {len(cards)} cards from CSV")
+            if row_count > len(cards):
+                print(f"🔗 Merged {row_count - len(cards)} duplicate rows")
             print(f"Sample cards: {[c['name'] for c in cards[:3]]}")
             print(f"Sample card format: {cards[0] if cards else 'None'}")
 
@@ -941,35 +1409,50 @@ def get_request_headers(auth_token: str = None) -> Dict[str, str]:
     """
     Get the headers needed for the request based on the inspector data
     """
-    headers = {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Content-Type": "application/json",
-        "Host": "api.ygoprog.com",
-        "Origin": "https://www.ygoprog.com",
-        "Sec-Ch-Ua": '"Chromium";v="140", "Not-A?Brand";v="24", "Microsoft Edge";v="140"',
-        "Sec-Ch-Ua-Mobile": "?0",
-        "Sec-Ch-Ua-Platform": '"Windows"',
-        "Sec-Fetch-Dest": "empty",
-        "Sec-Fetch-Mode": "cors",
-        "Sec-Fetch-Site": "same-site",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 Edg/140.0.0.0",
-    }
-
-    # Add authorization header if token is provided
-    if auth_token:
-        headers["Authorization"] = f"Bearer {auth_token}"
+    return dict(_headers_for(auth_token or None))
+
 
+@lru_cache(maxsize=4)
+def _headers_for(auth_token: Optional[str]) -> Tuple[Tuple[str, str], ...]:
+    """Build the header items once per token; evicted as tokens rotate"""
+    headers = tuple(_BASE_HEADERS.items())
+    if auth_token:
+        headers += (("Authorization", f"Bearer {auth_token}"),)
     return headers
 
 
+# Error bodies can be whole HTML pages from a gateway; only show the start
+_ERROR_BODY_PREVIEW_BYTES = 4096
+
+
+def _read_body_preview(response: requests.Response) -> str:
+    """Read at most _ERROR_BODY_PREVIEW_BYTES of a streamed response body"""
+    body = response.raw.read(_ERROR_BODY_PREVIEW_BYTES, decode_content=True)
+    return body.decode(response.encoding or "utf-8", "replace")
+
+
+# Network-level failures that may succeed on a later attempt, as opposed to a
+# request that is malformed or was rejected
+_TRANSIENT_ERRORS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+
+
+def _describe_request_error(error: requests.exceptions.RequestException) -> str:
+    """One-line description of a failed request"""
+    if isinstance(error, requests.exceptions.Timeout):
+        return "Request timed out"
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return "Connection error"
+    return f"Request failed: {error}"
+
+
 def test_binder_put_request(
     binder_id: str,
     payload: Dict[str, Any],
     auth: YGOProgAuth = None,
     auth_token: str = None,
     dry_run: bool = True,
+    session: Optional[requests.Session] = None,
+    verbose: bool = False,
 ) -> None:
     """
     Test the PUT request to the YGOProg binder API
@@ -980,9 +1463,19 @@ def test_binder_put_request(
         auth: YGOProgAuth instance for automatic authentication
         auth_token: Manual bearer token (alternative to auth)
         dry_run: If True, only print what would be sent without making the request
+        session: Shared requests.Session to send with (defaults to auth.session)
+        verbose: Print request headers and payload even when sending, plus the
+            full response headers and body
     """
     url = f"https://api.ygoprog.com/api/binder/{binder_id}/cards"
 
+    if session is None:
+        if auth:
+            session = auth.session
+        else:
+            session = requests.Session()
+            session.headers.update(_BASE_HEADERS)
+
     # Get token from auth system or use manual token
     token = None
     if auth:
@@ -991,29 +1484,37 @@ def test_binder_put_request(
         token = auth_token
 
     headers = get_request_headers(token)
+    # The session already carries the static headers; only send the token
+    auth_header = {"Authorization": headers["Authorization"]} if token else None
 
     print(f"=== Testing PUT Request to YGOProg Binder API ===")
     print(f"URL: {url}")
     print(f"Method: PUT")
     print()
 
-    print("Headers:")
-    for key, value in headers.items():
-        if key == "Authorization":
-            # Mask the token for security
+    # A dry run exists to show the request, so it always prints it; a real
+    # send only does with verbose, since a large payload dump is costly
+    if verbose or dry_run:
+        # Mask the token for security (computed once, outside the header loop)
+        display_headers = headers
+        if token:
+            value = headers["Authorization"]
             masked_token = (
                 f"Bearer {value[7:15]}...{value[-8:]}"
                 if len(value) > 15
                 else "Bearer [MASKED]"
             )
-            print(f"  {key}: {masked_token}")
-        else:
-            print(f"  {key}: {value}")
-    print()
+            display_headers = {**headers, "Authorization": masked_token}
 
-    print("Payload:")
-    print(json.dumps(payload, indent=2))
-    print()
+        sys.stdout.write(
+            "Headers:\n"
+            + "".join(f"  {key}: {value}\n" for key, value in display_headers.items())
+            + "\n"
+        )
+
+        print("Payload:")
+        _print_json(payload)
+        print()
 
     if not token:
         print("⚠️  WARNING - No authentication token available!")
@@ -1029,45 +1530,59 @@ def test_binder_put_request(
 
     try:
         print("Sending request...")
-        response = requests.put(url, json=payload, headers=headers, timeout=30)
-
-        print(f"Response Status Code: {response.status_code}")
-        print(f"Response Headers:")
-        for key, value in response.headers.items():
-            print(f"  {key}: {value}")
-        print()
+        # The cards endpoint replaces the binder's whole card list, so the
+        # payload always goes out as a single PUT
+        with session.put(
+            url, data=_dumps(payload), headers=auth_header, timeout=30, stream=True
+        ) as response:
+            print(f"Response Status Code: {response.status_code}")
+            if verbose:
+                sys.stdout.write(
+                    "Response Headers:\n"
+                    + "".join(
+                        f"  {key}: {value}\n" for key, value in response.headers.items()
+                    )
+                    + "\n"
+                )
 
-        if response.status_code == 200:
-            print("✅ SUCCESS - Request completed successfully")
-            try:
-                response_data = response.json()
-                print("Response JSON:")
-                print(json.dumps(response_data, indent=2))
-            except json.JSONDecodeError:
+            if response.status_code == 200:
+                print("✅ SUCCESS - Request completed successfully")
+                if verbose:
+                    try:
+                        response_data = _loads(response.content)
+                        print("Response JSON:")
+                        _print_json(response_data)
+                    except json.JSONDecodeError:
+                        print("Response Text:")
+                        print(response.text)
+            elif response.status_code == 401:
+                print("❌ ERROR - Authentication failed (401 Unauthorized)")
+                print(
+                    "   Make sure you provide valid credentials or a valid bearer token"
+                )
+                if auth and not auth.is_token_valid():
+                    print(
+                        "   Your stored token may have expired - try logging in again"
+                    )
+            else:
+                print(
+                    f"❌ ERROR - Request failed with status code {response.status_code}"
+                )
                 print("Response Text:")
-                print(response.text)
-        elif response.status_code == 401:
-            print("❌ ERROR - Authentication failed (401 Unauthorized)")
-            print("   Make sure you provide valid credentials or a valid bearer token")
-            if auth and not auth.is_token_valid():
-                print("   Your stored token may have expired - try logging in again")
-        else:
-            print(f"❌ ERROR - Request failed with status code {response.status_code}")
-            print("Response Text:")
-            print(response.text)
-
-    except requests.exceptions.Timeout:
-        print("❌ ERROR - Request timed out")
-    except requests.exceptions.ConnectionError:
-        print("❌ ERROR - Connection error")
+                print(_read_body_preview(response))
+
     except requests.exceptions.RequestException as e:
-        print(f"❌ ERROR - Request failed: {e}")
+        print(f"❌ ERROR - {_describe_request_error(e)}")
+        if isinstance(e, _TRANSIENT_ERRORS):
+            print("   This looks transient and already survived the session retries")
 
 
 def main():
     """Main function to run the script"""
     import argparse
-    import getpass
+
+    # Argument defaults below come from the environment, so load .env first
+    _load_env()
 
     parser = argparse.ArgumentParser(
         description="YGOProg Binder Management Tool - Sync, list, and export binders"
@@ -1131,6 +1646,11 @@ def main():
     sync_group.add_argument(
         "--custom-payload", help="Path to JSON file with custom payload for sync"
     )
+    sync_group.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print full request/response JSON for binder operations",
+    )
 
     # Authentication options
     auth_group = parser.add_argument_group("Authentication Options")
@@ -1181,7 +1701,12 @@ def main():
     elif args.username or args.password:
         auth = YGOProgAuth(args.token_file)
         username = args.username or input("YGOProg Username: ")
-        password = args.password or getpass.getpass("YGOProg Password: ")
+        if args.password:
+            password = args.password
+        else:
+            import getpass
+
+            password = getpass.getpass("YGOProg Password: ")
         if not auth.ensure_valid_token(username, password):
             print("❌ Authentication failed")
             sys.exit(1)
@@ -1223,13 +1748,13 @@ def main():
 
     # Create binder manager
     if auth:
-        binder_mgr = YGOProgBinder(auth)
+        binder_mgr = YGOProgBinder(auth, verbose=args.verbose)
     else:
         # For manual token, create a minimal auth object
         temp_auth = YGOProgAuth()
         temp_auth.token = manual_token
         temp_auth.token_data = {"exp": 9999999999}  # Fake expiry for validation
-        binder_mgr = YGOProgBinder(temp_auth)
+        binder_mgr = YGOProgBinder(temp_auth, verbose=args.verbose)
 
     # Handle different actions
     if args.list_binders:
@@ -1385,8 +1910,7 @@ def main():
         # Load payload
         if args.custom_payload:
             try:
-                with open(args.custom_payload, "r") as f:
-                    payload = json.load(f)
+                payload = _load_json_file(args.custom_payload)
             except FileNotFoundError:
                 print(
                     f"❌ ERROR - Custom payload file not found: {args.custom_payload}"
@@ -1400,7 +1924,13 @@ def main():
 
         # Run the sync test
         test_binder_put_request(
-            args.binder_id, payload, auth, manual_token, dry_run=not args.send
+            args.binder_id,
+            payload,
+            auth,
+            manual_token,
+            dry_run=not args.send,
+            session=binder_mgr.auth.session,
+            verbose=args.verbose,
         )
         sys.exit(0)  # Exit after sync test
 
@@ -1422,8 +1952,7 @@ def main():
         # Load payload
         if args.custom_payload:
             try:
-                with open(args.custom_payload, "r") as f:
-                    payload = json.load(f)
+                payload = _load_json_file(args.custom_payload)
             except FileNotFoundError:
                 print(
                     f"❌ ERROR - Custom payload file not found: {args.custom_payload}"
@@ -1437,7 +1966,13 @@ def main():
 
         # Run the sync test
         test_binder_put_request(
-            args.binder_id, payload, auth, manual_token, dry_run=not args.send
+            args.binder_id,
+            payload,
+            auth,
+            manual_token,
+            dry_run=not args.send,
+            session=binder_mgr.auth.session,
+            verbose=args.verbose,
         )
 
 
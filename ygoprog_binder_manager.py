@@ -12,15 +12,47 @@ Features:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
 import sys
 import os
 import base64
 import getpass
+import gzip
 import csv
 import argparse
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+# Prefer orjson for (de)serialization, falling back to the stdlib json module
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _loads(data: Any) -> Any:
+    """Deserialize JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # Try to load environment variables
 try:
@@ -31,6 +63,62 @@ try:
 except ImportError:
     DOTENV_AVAILABLE = False
 
+# Static headers for binder API requests; the bearer token is kept on the session
+_API_HEADERS = {
+    "Accept": "*/*",
+    # Only the codecs urllib3 can decode here (br/zstd need brotli/zstandard)
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Content-Type": "application/json",
+    "Origin": "https://www.ygoprog.com",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+}
+
+# Read size when streaming a CSV export to disk
+_EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Card uploads at least this large are sent gzip-compressed
+_GZIP_MIN_BYTES = 64 * 1024
+
+# A 415, or a 400 whose body mentions one of these, means the server could not
+# take a gzip-encoded request body (any other 400 is a real validation error)
+_GZIP_REJECTED_HINTS = ("encoding", "gzip", "compress")
+
+# How long a fetched binder is reused before it is fetched again
+_BINDER_CACHE_TTL_SECONDS = 30.0
+
+# A rate-limited count update is sent again up to this many times, waiting
+# for Retry-After (capped) or an exponential backoff when it is missing
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_MAX_WAIT_SECONDS = 30.0
+
+# Upper bound on concurrent binder exports sharing the session pool
+_MAX_PARALLEL_EXPORTS = 8
+
+# Treat tokens as expired this many seconds before their real expiry
+TOKEN_EXPIRY_BUFFER_SECONDS = 300
+
+
+def _retry_after_seconds(response: requests.Response, attempt: int) -> float:
+    """Seconds to wait before replaying a rate-limited request"""
+    value = response.headers.get("Retry-After", "")
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+            delay = (retry_at - datetime.now(retry_at.tzinfo)).total_seconds()
+        except (TypeError, ValueError):
+            delay = 2.0**attempt
+    return min(max(delay, 0.0), _RATE_LIMIT_MAX_WAIT_SECONDS)
+
+
+@lru_cache(maxsize=4)
+def _decode_jwt(token: str) -> Dict[str, Any]:
+    """Decode a JWT's payload segment (base64url, unpadded); shared, do not mutate"""
+    payload = token.split(".")[1]
+    return _loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+
 
 class YGOProgAuth:
     """Handle authentication with YGOProg API"""
@@ -40,10 +128,58 @@ class YGOProgAuth:
         self.token_file = token_file or os.getenv(
             "YGOPROG_TOKEN_FILE", "ygoprog_token.json"
         )
+        # Shared session so login and every binder call reuse pooled keep-alive
+        # connections; gateway hiccups are retried for GET/HEAD/DELETE only (a
+        # replayed count-delta PUT or create POST would be applied twice), and
+        # the last response still reaches the normal status handling
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset({"GET", "HEAD", "DELETE"}),
+                    raise_on_status=False,
+                ),
+            ),
+        )
         self.token = None
         self.token_data = None
+        # Token currently stored in token_file, so an unchanged one is not rewritten
+        self._saved_token: Optional[str] = None
         self.load_token()
 
+    @property
+    def token(self) -> Optional[str]:
+        """Raw bearer token"""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]):
+        # Keep the session's Authorization header in step with the token, so a
+        # refreshed login is picked up by every later request
+        self._token = value
+        if value:
+            self.session.headers["Authorization"] = f"Bearer {value}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    @property
+    def token_data(self) -> Optional[Dict[str, Any]]:
+        """Decoded JWT payload"""
+        return self._token_data
+
+    @token_data.setter
+    def token_data(self, value: Optional[Dict[str, Any]]):
+        # Parse the expiry once so validity checks are a single float compare
+        self._token_data = value
+        exp = value.get("exp") if value else None
+        self._exp_epoch = float(exp) - TOKEN_EXPIRY_BUFFER_SECONDS if exp else 0.0
+
     @classmethod
     def from_env(cls) -> "YGOProgAuth":
         """Create YGOProgAuth instance using environment variables"""
@@ -77,12 +213,12 @@ class YGOProgAuth:
 
         try:
             print(f"Logging in to YGOProg as {username}...")
-            response = requests.post(
-                login_url, json=payload, headers=headers, timeout=30
+            response = self.session.post(
+                login_url, data=_dumps(payload), headers=headers, timeout=30
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data.get("success"):
                     self.token = data.get("token")
                     if self.token:
@@ -99,7 +235,7 @@ class YGOProgAuth:
                 print(f"❌ Login request failed with status {response.status_code}")
                 return False
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"❌ Login request failed: {e}")
             return False
 
@@ -110,37 +246,56 @@ class YGOProgAuth:
 
         try:
             # Decode JWT payload
-            header, payload, signature = self.token.split(".")
-            payload += "=" * (4 - len(payload) % 4)
-            payload_decoded = base64.b64decode(payload)
-            self.token_data = json.loads(payload_decoded)
-
-            # Save to file
-            token_info = {
-                "token": self.token,
-                "decoded": self.token_data,
-                "saved_at": datetime.now().isoformat(),
-            }
+            self.token_data = _decode_jwt(self.token)
 
-            with open(self.token_file, "w") as f:
-                json.dump(token_info, f, indent=2)
+            # The token file already holds this exact token
+            if self.token == self._saved_token:
+                return
 
+            self._save_token_file()
             print(f"Token saved to {self.token_file}")
 
         except Exception as e:
             print(f"Warning: Could not decode/save token: {e}")
 
+    def _save_token_file(self):
+        """Write the token and its decoded payload to the token file"""
+        token_info = {
+            "token": self.token,
+            "decoded": self.token_data,
+            "saved_at": datetime.now().isoformat(),
+        }
+
+        # Write a private temp file next to the target, then atomically swap it
+        # into place so a crash never leaves a truncated token file
+        data = _dumps(token_info, indent=True)
+        token_dir = os.path.dirname(os.path.abspath(self.token_file))
+        fd, tmp_file = tempfile.mkstemp(dir=token_dir, suffix=".tmp")
+        try:
+            os.chmod(tmp_file, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_file, self.token_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        self._saved_token = self.token
+
     def load_token(self):
         """Load token from file if it exists and is valid"""
         if not os.path.exists(self.token_file):
             return
 
         try:
-            with open(self.token_file, "r") as f:
-                token_info = json.load(f)
+            with open(self.token_file, "rb") as f:
+                token_info = _loads(f.read())
 
             self.token = token_info.get("token")
+            self._saved_token = self.token
             self.token_data = token_info.get("decoded")
+            if self.token and not self.token_data:
+                self.token_data = _decode_jwt(self.token)
 
             if self.is_token_valid():
                 print(f"✅ Loaded valid token from {self.token_file}")
@@ -154,18 +309,7 @@ class YGOProgAuth:
 
     def is_token_valid(self) -> bool:
         """Check if current token is valid and not expired"""
-        if not self.token or not self.token_data:
-            return False
-
-        exp = self.token_data.get("exp")
-        if not exp:
-            return False
-
-        expires_at = datetime.fromtimestamp(exp)
-        now = datetime.now()
-        buffer = timedelta(minutes=5)
-
-        return expires_at > (now + buffer)
+        return bool(self.token) and time.time() < self._exp_epoch
 
     def get_token(self) -> Optional[str]:
         """Get current valid token"""
@@ -215,36 +359,95 @@ class YGOProgBinderManager:
     def __init__(self, auth: YGOProgAuth):
         self.auth = auth
         self.base_url = "https://api.ygoprog.com"
-
-    def _get_api_headers(self) -> Dict[str, str]:
-        """Get headers for API requests"""
-        return {
-            "Accept": "*/*",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Content-Type": "application/json",
-            "Host": "api.ygoprog.com",
-            "Origin": "https://www.ygoprog.com",
-            "Authorization": f"Bearer {self.auth.get_token()}",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        }
-
-    def get_binder_contents(self, binder_id: str) -> Dict[str, Any]:
-        """Get contents of a specific binder"""
+        # Headers are set on the shared session once instead of per request
+        self.session = auth.session
+        self.session.headers.update(_API_HEADERS)
+        # binder_id -> (monotonic fetch time, binder data, revalidation headers)
+        self._binder_cache: Dict[
+            str, Tuple[float, Dict[str, Any], Dict[str, str]]
+        ] = {}
+        # binder_id -> (binder data it was built from, (code, rarity) -> card)
+        self._card_index_cache: Dict[
+            str, Tuple[Dict[str, Any], Dict[Tuple[str, str], Dict[str, Any]]]
+        ] = {}
+        # Cleared once the server refuses a compressed upload
+        self._gzip_uploads = True
+
+    def _invalidate_binder(self, binder_id: str):
+        """Drop cached lookups for a binder after a request that may have modified it"""
+        self._binder_cache.pop(binder_id, None)
+        self._card_index_cache.pop(binder_id, None)
+
+    def get_binder_index(self, binder_id: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Get a binder's cards keyed by (code, rarity), keeping the first match
+        The index is rebuilt only when the binder's contents change
+        """
+        binder_data = self.get_binder_contents(binder_id)
+        cached = self._card_index_cache.get(binder_id)
+        if cached and cached[0] is binder_data:
+            return cached[1]
+
+        index: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for card in binder_data.get("cards", []):
+            index.setdefault((card.get("code", ""), card.get("rarity", "")), card)
+        if binder_data:
+            self._card_index_cache[binder_id] = (binder_data, index)
+        return index
+
+    @staticmethod
+    def _revalidation_headers(response: requests.Response) -> Dict[str, str]:
+        """Conditional request headers matching a response's validators"""
+        headers = {}
+        etag = response.headers.get("ETag")
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get_binder_contents(self, binder_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get contents of a specific binder
+        Reuses a copy fetched within the last few seconds unless refresh is set;
+        after that the copy is revalidated with a conditional GET
+        """
         if not self.auth.is_token_valid():
             print("❌ No valid authentication token")
             return {}
 
+        cached = self._binder_cache.get(binder_id)
+        if (
+            cached
+            and not refresh
+            and time.monotonic() - cached[0] < _BINDER_CACHE_TTL_SECONDS
+        ):
+            return cached[1]
+
         url = f"{self.base_url}/api/binder/{binder_id}"
-        headers = self._get_api_headers()
+        # Ask the server to skip the body if the binder is unchanged since the
+        # cached copy
+        conditional_headers = cached[2] if cached else None
 
         try:
             print(f"🔍 Fetching binder contents for ID: {binder_id}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(
+                url, headers=conditional_headers, timeout=30
+            )
 
-            if response.status_code == 200:
-                data = response.json()
+            if response.status_code == 304 and cached:
+                print("✅ Binder unchanged, reusing cached contents")
+                self._binder_cache[binder_id] = (time.monotonic(), *cached[1:])
+                return cached[1]
+            elif response.status_code == 200:
+                data = _loads(response.content)
                 print("✅ Successfully retrieved binder contents")
+                self._binder_cache[binder_id] = (
+                    time.monotonic(),
+                    data,
+                    self._revalidation_headers(response),
+                )
                 return data
             elif response.status_code == 404:
                 print(f"❌ Binder not found: {binder_id}")
@@ -253,7 +456,7 @@ class YGOProgBinderManager:
             else:
                 print(f"❌ Failed to get binder contents: {response.status_code}")
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"❌ Request failed: {e}")
 
         return {}
@@ -265,15 +468,14 @@ class YGOProgBinderManager:
             return None
 
         url = f"{self.base_url}/api/binder/{name}"
-        headers = self._get_api_headers()
         payload = {"name": name, "description": description, "cards": []}
 
         try:
             print(f"🆕 Creating binder '{name}'...")
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self.session.post(url, data=_dumps(payload), timeout=30)
 
             if response.status_code in [200, 201]:
-                data = response.json()
+                data = _loads(response.content)
                 binder_id = data.get("_id") or data.get("id")
                 if binder_id:
                     print(f"✅ Binder '{name}' created successfully! ID: {binder_id}")
@@ -286,7 +488,7 @@ class YGOProgBinderManager:
                 print(f"Response: {response.text[:200]}")
                 return None
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"❌ Request failed: {e}")
             return None
 
@@ -297,11 +499,11 @@ class YGOProgBinderManager:
             return False
 
         url = f"{self.base_url}/api/binder/{binder_id}"
-        headers = self._get_api_headers()
 
         try:
             print(f"🗑️ Deleting binder {binder_id}...")
-            response = requests.delete(url, headers=headers, timeout=30)
+            response = self.session.delete(url, timeout=30)
+            self._invalidate_binder(binder_id)
 
             if response.status_code in [200, 204]:
                 print("✅ Binder deleted successfully!")
@@ -331,16 +533,28 @@ class YGOProgBinderManager:
             return False
 
         url = f"{self.base_url}/api/binder/{binder_id}/card/count"
-        headers = self._get_api_headers()
         payload = {"code": card_code, "rarity": rarity, "count": count_delta}
 
         try:
             print(f"🔄 Updating card count: {card_code} ({rarity}) by {count_delta}")
-            response = requests.put(url, json=payload, headers=headers, timeout=30)
+            body = _dumps(payload)
+            for attempt in range(_RATE_LIMIT_RETRIES + 1):
+                response = self.session.put(url, data=body, timeout=30)
+                if response.status_code != 429 or attempt == _RATE_LIMIT_RETRIES:
+                    break
+                # A 429 means the delta was not applied, so sending it again is safe
+                delay = _retry_after_seconds(response, attempt)
+                print(f"⏳ Rate limited, retrying in {delay:.1f}s...")
+                time.sleep(delay)
+            self._invalidate_binder(binder_id)
 
             if response.status_code == 200:
                 print("✅ Card count updated successfully!")
                 return True
+            elif response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "unknown")
+                print(f"❌ Rate limited (Retry-After: {retry_after})")
+                return False
             else:
                 print(f"❌ Update failed with status {response.status_code}")
                 return False
@@ -349,6 +563,17 @@ class YGOProgBinderManager:
             print(f"❌ Request failed: {e}")
             return False
 
+    def update_card_counts(
+        self, binder_id: str, updates: List[Tuple[str, str, int]]
+    ) -> List[bool]:
+        """
+        Apply several (card_code, rarity, count_delta) updates one at a time
+        Deltas against the same binder are not atomic on the server, so they
+        are never sent concurrently
+        Returns one success flag per update, in the same order
+        """
+        return [self.update_card_count(binder_id, *update) for update in updates]
+
     def remove_card(self, binder_id: str, card_code: str, rarity: str) -> bool:
         """Remove a card from binder by setting its count to 0"""
         if not self.auth.is_token_valid():
@@ -357,14 +582,7 @@ class YGOProgBinderManager:
 
         # Get current binder contents to find the card
         print(f"🔍 Looking for card {card_code} ({rarity}) in binder...")
-        binder_data = self.get_binder_contents(binder_id)
-        cards = binder_data.get("cards", [])
-
-        target_card = None
-        for card in cards:
-            if card.get("code", "") == card_code and card.get("rarity", "") == rarity:
-                target_card = card
-                break
+        target_card = self.get_binder_index(binder_id).get((card_code, rarity))
 
         if not target_card:
             print(f"❌ Card {card_code} ({rarity}) not found in binder")
@@ -382,6 +600,95 @@ class YGOProgBinderManager:
         # Remove all copies by setting count to negative current count
         return self.update_card_count(binder_id, card_code, rarity, -current_count)
 
+    def remove_card_fast(
+        self, binder_id: str, card_code: str, rarity: str, count: int
+    ) -> bool:
+        """
+        Remove count copies of a card with a single count update, skipping the
+        binder fetch; count is the quantity the caller already knows is held
+        """
+        if count <= 0:
+            print(f"❌ Count to remove must be positive, got {count}")
+            return False
+
+        print(f"🗑️ Removing {count}x {card_code} ({rarity})")
+        return self.update_card_count(binder_id, card_code, rarity, -count)
+
+    @staticmethod
+    def _rejected_gzip(response: requests.Response) -> bool:
+        """Whether the server refused a request because its body was gzip-encoded"""
+        if response.status_code == 415:
+            return True
+        if response.status_code != 400:
+            return False
+        text = response.text.lower()
+        return any(hint in text for hint in _GZIP_REJECTED_HINTS)
+
+    def _put_json_body(self, url: str, body: bytes) -> requests.Response:
+        """PUT a JSON body, gzip-compressing large ones unless the server refused that before"""
+        if self._gzip_uploads and len(body) >= _GZIP_MIN_BYTES:
+            response = self.session.put(
+                url,
+                data=gzip.compress(body, compresslevel=4),
+                headers={"Content-Encoding": "gzip"},
+                timeout=30,
+            )
+            if not self._rejected_gzip(response):
+                return response
+            print("⚠️ Server rejected the compressed upload, resending uncompressed")
+            self._gzip_uploads = False
+
+        return self.session.put(url, data=body, timeout=30)
+
+    def remove_cards(
+        self,
+        binder_id: str,
+        targets: List[Tuple[str, str]],
+        counts: Optional[List[int]] = None,
+    ) -> bool:
+        """
+        Remove several (card_code, rarity) cards, one count update per card
+        With counts (the known quantity of each target, in order), the binder
+        lookup is skipped as in remove_card_fast
+        Returns True only if every card was removed (or already had 0 count)
+        """
+        if not self.auth.is_token_valid():
+            print("❌ No valid authentication token")
+            return False
+
+        all_found = True
+        if counts is not None:
+            if len(counts) != len(targets) or any(count <= 0 for count in counts):
+                print("❌ Give one positive count per card to remove")
+                return False
+            updates = [
+                (card_code, rarity, -count)
+                for (card_code, rarity), count in zip(targets, counts)
+            ]
+        else:
+            index = self.get_binder_index(binder_id)
+            updates = []
+            for card_code, rarity in targets:
+                target_card = index.get((card_code, rarity))
+                if not target_card:
+                    print(f"❌ Card {card_code} ({rarity}) not found in binder")
+                    all_found = False
+                    continue
+
+                current_count = target_card.get("count", 0)
+                if current_count <= 0:
+                    print(f"⚠️ Card {card_code} ({rarity}) already has 0 count")
+                    continue
+
+                print(f"🗑️ Removing {current_count}x {target_card.get('name', 'Unknown')} ({card_code} - {rarity})")
+                updates.append((card_code, rarity, -current_count))
+
+        results = self.update_card_counts(binder_id, updates)
+        failed = results.count(False)
+        if failed:
+            print(f"❌ {failed} of {len(updates)} card removals failed")
+        return all_found and not failed
+
     def add_cards_to_binder(self, binder_id: str, cards: List[Dict[str, Any]]) -> bool:
         """Add cards to a binder"""
         if not self.auth.is_token_valid():
@@ -389,16 +696,16 @@ class YGOProgBinderManager:
             return False
 
         url = f"{self.base_url}/api/binder/{binder_id}/cards"
-        headers = self._get_api_headers()
         payload = {"cards": cards}
 
         try:
             print(f"📤 Adding {len(cards)} cards to binder...")
-            response = requests.put(url, json=payload, headers=headers, timeout=30)
+            response = self._put_json_body(url, _dumps(payload))
+            self._invalidate_binder(binder_id)
 
             if response.status_code == 200:
                 try:
-                    response_data = response.json()
+                    response_data = _loads(response.content)
                     returned_cards = response_data.get("cards", [])
                     print(f"✅ Server reports {len(returned_cards)} cards in binder")
                     return True
@@ -415,53 +722,109 @@ class YGOProgBinderManager:
             print(f"❌ Request failed: {e}")
             return False
 
+    def iter_csv_cards(self, csv_file_path: str) -> Iterator[Dict[str, Any]]:
+        """Parse a CSV file lazily, yielding one YGOProg card dict per valid row"""
+        with open(csv_file_path, "r", encoding="utf-8", newline="") as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            # Resolve column positions once; absent columns point at a padding
+            # slot past the end of the header so they read as ""
+            width = len(header)
+            columns = {name: i for i, name in enumerate(header)}
+            name_i, cardid_i, count_i, rarity_i, set_i, code_i = (
+                columns.get(column, width)
+                for column in (
+                    "cardname", "cardid", "cardq", "cardrarity", "cardset", "cardcode"
+                )
+            )
+            padding = [""] * (width + 1)
+
+            row_num = 0
+            for row in reader:
+                if not row:
+                    continue
+                row_num += 1
+                if len(row) <= width:
+                    row.extend(padding[len(row):])
+
+                # Extract and validate data
+                name = row[name_i].strip()
+                cardid_str = row[cardid_i].strip()
+                count_str = row[count_i].strip()
+                rarity = row[rarity_i].strip()
+                card_set = row[set_i].strip()
+                code = row[code_i].strip()
+
+                # Parse numbers directly (EAFP) rather than scanning with isdigit first
+                try:
+                    cardid = int(cardid_str)
+                except ValueError:
+                    cardid = -1
+
+                # Validate required fields
+                if not name or cardid < 0:
+                    print(f"⚠️ Row {row_num}: Invalid data for '{name}', skipping")
+                    continue
+
+                try:
+                    count = int(count_str)
+                except ValueError:
+                    count = 1
+                if count < 0:
+                    count = 1
+
+                # Map CSV columns to YGOProg format
+                yield {
+                    "name": name,
+                    "cardId": cardid,
+                    "count": count,
+                    "rarity": rarity or "Unknown",
+                    "set": card_set or "Unknown",
+                    "code": code,
+                }
+
+    @staticmethod
+    def _merge_duplicate_cards(cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge cards for the same printing (cardId, rarity, set, code) into one
+        entry with the counts summed, keeping first-seen order
+        """
+        merged: Dict[Tuple[int, str, str, str], Dict[str, Any]] = {}
+        for card in cards:
+            key = (card["cardId"], card["rarity"], card["set"], card["code"])
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = card
+            else:
+                existing["count"] += card["count"]
+        return list(merged.values())
+
     def import_csv_to_binder(self, csv_file_path: str, binder_id: str) -> bool:
-        """Import cards from a CSV file to a binder"""
+        """
+        Import cards from a CSV file to a binder
+        The cards go up in a single PUT, since the endpoint replaces the
+        binder's whole card list
+        """
         if not self.auth.is_token_valid():
             print("❌ No valid authentication token")
             return False
 
         try:
             print(f"📥 Reading CSV file: {csv_file_path}")
-            cards = []
-
-            with open(csv_file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-
-                for row_num, row in enumerate(reader, 1):
-                    # Extract and validate data
-                    name = row.get("cardname", "").strip()
-                    cardid_str = row.get("cardid", "").strip()
-                    count_str = row.get("cardq", "1").strip()
-                    rarity = row.get("cardrarity", "").strip()
-                    card_set = row.get("cardset", "").strip()
-                    code = row.get("cardcode", "").strip()
-
-                    # Validate required fields
-                    if not name or not cardid_str or not cardid_str.isdigit():
-                        print(f"⚠️ Row {row_num}: Invalid data for '{name}', skipping")
-                        continue
-
-                    cardid = int(cardid_str)
-                    count = int(count_str) if count_str.isdigit() else 1
-
-                    # Map CSV columns to YGOProg format
-                    card = {
-                        "name": name,
-                        "cardId": cardid,
-                        "count": count,
-                        "rarity": rarity if rarity else "Unknown",
-                        "set": card_set if card_set else "Unknown",
-                        "code": code if code else "",
-                    }
-
-                    cards.append(card)
+            # Exporters often emit one row per copy; send each printing once
+            rows = list(self.iter_csv_cards(csv_file_path))
+            cards = self._merge_duplicate_cards(rows)
 
             if not cards:
                 print("❌ No valid cards found in CSV file")
                 return False
 
             print(f"📊 Parsed {len(cards)} cards from CSV")
+            if len(rows) > len(cards):
+                print(f"🔗 Merged {len(rows) - len(cards)} duplicate rows")
             print(f"Sample cards: {[c['name'] for c in cards[:3]]}")
 
             # Upload cards to binder
@@ -482,60 +845,88 @@ class YGOProgBinderManager:
 
         # Use the dedicated CSV export API endpoint
         url = f"{self.base_url}/api/export/binder/csv/{binder_id}"
-        headers = self._get_api_headers()
-        # Override Content-Type for CSV endpoint
-        headers["Accept"] = "text/csv"
+        # Override Accept for the CSV endpoint
+        headers = {"Accept": "text/csv"}
 
         try:
             print(f"📤 Requesting CSV export for binder ID: {binder_id}")
-            response = requests.get(url, headers=headers, timeout=30)
-
-            if response.status_code == 200:
-                # Generate filename if not provided
-                if not filename:
-                    # Try to get filename from Content-Disposition header
-                    content_disposition = response.headers.get(
-                        "Content-Disposition", ""
-                    )
-                    if "filename=" in content_disposition:
-                        # Extract filename from header like "attachment; filename=data.csv"
-                        filename = (
-                            content_disposition.split("filename=")[1].strip().strip('"')
+            with self.session.get(
+                url, headers=headers, stream=True, timeout=30
+            ) as response:
+                if response.status_code == 200:
+                    # Generate filename if not provided
+                    if not filename:
+                        # Try to get filename from Content-Disposition header
+                        content_disposition = response.headers.get(
+                            "Content-Disposition", ""
                         )
-                    else:
-                        # Fallback to default naming
-                        filename = f"binder_{binder_id[:8]}.csv"
-
-                # Write CSV content to file
-                with open(filename, "w", encoding="utf-8", newline="") as csvfile:
-                    csvfile.write(response.text)
-
-                # Count lines to report number of cards (subtract 1 for header, ignore empty lines)
-                lines = [
-                    line.strip()
-                    for line in response.text.strip().split("\n")
-                    if line.strip()
-                ]
-                card_count = max(0, len(lines) - 1) if lines else 0
-                print(f"✅ Exported {card_count} cards to {filename}")
-                return True
+                        if "filename=" in content_disposition:
+                            # Extract filename from header like "attachment; filename=data.csv"
+                            filename = (
+                                content_disposition.split("filename=")[1]
+                                .strip()
+                                .strip('"')
+                            )
+                        else:
+                            # Fallback to default naming
+                            filename = f"binder_{binder_id[:8]}.csv"
+
+                    # Stream the CSV bytes straight to disk, counting lines as they pass
+                    line_count = 0
+                    last_byte = b"\n"
+                    with open(filename, "wb") as csvfile:
+                        for chunk in response.iter_content(_EXPORT_CHUNK_BYTES):
+                            if not chunk:
+                                continue
+                            line_count += chunk.count(b"\n")
+                            last_byte = chunk[-1:]
+                            csvfile.write(chunk)
+                    if last_byte != b"\n":
+                        # Final line has no trailing newline
+                        line_count += 1
+
+                    # Subtract 1 for the header row
+                    card_count = max(0, line_count - 1)
+                    print(f"✅ Exported {card_count} cards to {filename}")
+                    return True
 
-            elif response.status_code == 404:
-                print(f"❌ Binder not found: {binder_id}")
-                return False
-            elif response.status_code == 403:
-                print(f"❌ Access denied to binder: {binder_id}")
-                return False
-            else:
-                print(f"❌ CSV export failed with status {response.status_code}")
-                if response.text:
-                    print(f"Response: {response.text[:200]}")
-                return False
+                elif response.status_code == 404:
+                    print(f"❌ Binder not found: {binder_id}")
+                    return False
+                elif response.status_code == 403:
+                    print(f"❌ Access denied to binder: {binder_id}")
+                    return False
+                else:
+                    print(f"❌ CSV export failed with status {response.status_code}")
+                    if response.text:
+                        print(f"Response: {response.text[:200]}")
+                    return False
 
         except requests.exceptions.RequestException as e:
             print(f"❌ Request failed: {e}")
             return False
 
+    def export_binders_to_csv(self, binder_ids: List[str]) -> List[bool]:
+        """
+        Export several binders to CSV concurrently, to binder_<id>.csv each
+        (the server's suggested filename may be the same for every binder)
+        Returns one success flag per binder, in the same order
+        """
+        if not binder_ids:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_PARALLEL_EXPORTS, len(binder_ids))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda binder_id: self.export_binder_to_csv(
+                        binder_id, f"binder_{binder_id}.csv"
+                    ),
+                    binder_ids,
+                )
+            )
+
 
 def main():
     """Main function to run the script"""
@@ -558,16 +949,30 @@ def main():
         help="Import cards from CSV file to a binder (requires --binder-id)",
     )
     parser.add_argument(
-        "--export-csv", metavar="BINDER_ID", help="Export binder contents to CSV file"
+        "--export-csv",
+        nargs="+",
+        metavar="BINDER_ID",
+        help="Export one or more binders to CSV files (several are exported in parallel)",
     )
     parser.add_argument(
-        "--export-filename", help="Custom filename for CSV export (optional)"
+        "--export-filename",
+        help="Custom filename for CSV export of a single binder (optional)",
     )
     parser.add_argument(
         "--remove-card",
         nargs=2,
+        action="append",
         metavar=("CARD_CODE", "RARITY"),
-        help="Remove a card by code and rarity (requires --binder-id)",
+        help="Remove a card by code and rarity (requires --binder-id); repeat to "
+        "remove several cards",
+    )
+    parser.add_argument(
+        "--fast-remove",
+        type=int,
+        action="append",
+        metavar="COUNT",
+        help="With --remove-card, skip the binder lookup and remove COUNT copies; "
+        "give one per --remove-card, in the same order",
     )
     parser.add_argument(
         "--add-card",
@@ -650,9 +1055,18 @@ def main():
             sys.exit(1)
 
     elif args.export_csv:
-        print(f"📤 Exporting binder {args.export_csv} to CSV...")
-        if not binder_mgr.export_binder_to_csv(args.export_csv, args.export_filename):
-            sys.exit(1)
+        if len(args.export_csv) == 1:
+            binder_id = args.export_csv[0]
+            print(f"📤 Exporting binder {binder_id} to CSV...")
+            if not binder_mgr.export_binder_to_csv(binder_id, args.export_filename):
+                sys.exit(1)
+        else:
+            if args.export_filename:
+                print("❌ --export-filename only applies to a single binder")
+                sys.exit(1)
+            print(f"📤 Exporting {len(args.export_csv)} binders to CSV...")
+            if not all(binder_mgr.export_binders_to_csv(args.export_csv)):
+                sys.exit(1)
 
     elif args.import_csv:
         if not args.binder_id:
@@ -666,10 +1080,25 @@ def main():
         if not args.binder_id:
             print("❌ --binder-id required for removing cards")
             sys.exit(1)
-        card_code, rarity = args.remove_card
-        print(f"🗑️ Removing card {card_code} ({rarity}) from binder {args.binder_id}")
-        if not binder_mgr.remove_card(args.binder_id, card_code, rarity):
+        if args.fast_remove and len(args.fast_remove) != len(args.remove_card):
+            print("❌ --fast-remove needs one COUNT per --remove-card")
             sys.exit(1)
+        if len(args.remove_card) == 1:
+            card_code, rarity = args.remove_card[0]
+            print(f"🗑️ Removing card {card_code} ({rarity}) from binder {args.binder_id}")
+            if args.fast_remove:
+                removed = binder_mgr.remove_card_fast(
+                    args.binder_id, card_code, rarity, args.fast_remove[0]
+                )
+            else:
+                removed = binder_mgr.remove_card(args.binder_id, card_code, rarity)
+            if not removed:
+                sys.exit(1)
+        else:
+            print(f"🗑️ Removing {len(args.remove_card)} cards from binder {args.binder_id}")
+            targets = [tuple(target) for target in args.remove_card]
+            if not binder_mgr.remove_cards(args.binder_id, targets, counts=args.fast_remove):
+                sys.exit(1)
 
     elif args.add_card:
         if not args.binder_id: